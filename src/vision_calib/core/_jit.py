@@ -0,0 +1,27 @@
+"""Optional numba acceleration for core kernels.
+
+numba is an optional dependency (``speedups`` extra) and costs several
+hundred milliseconds to import, so it is only imported the first time a
+caller actually asks for a compiled kernel.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Callable, Optional
+
+
+@lru_cache(maxsize=None)
+def optional_njit(func: Callable) -> Optional[Callable]:
+    """Compile ``func`` with numba, or return None if numba is unavailable.
+
+    The compiled kernel uses NumPy floating-point semantics (division by
+    zero yields inf/NaN instead of raising) so it matches the NumPy
+    fallback it replaces. Results are cached per function.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    compiled: Callable = njit(cache=True, error_model="numpy")(func)
+    return compiled
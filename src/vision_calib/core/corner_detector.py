@@ -78,6 +78,10 @@ class CornerDetector:
     SUBPIX_WINDOW_SIZE = (11, 11)
     SUBPIX_ZERO_ZONE = (-1, -1)
 
+    # Coarse detection runs on an image halved until its longest side is
+    # below this, then corners are refined on the full-resolution image
+    DETECTION_MAX_DIM = 1500
+
     # Detection flags
     DEFAULT_FLAGS = (
         cv2.CALIB_CB_ADAPTIVE_THRESH
@@ -115,11 +119,12 @@ class CornerDetector:
         Returns:
             CornerDetectionResult with detection outcome.
         """
-        # Load image if path provided
+        # Load image if path provided. Detection only needs intensity, so
+        # decode straight to grayscale rather than decoding BGR and converting
         image_path: Optional[Path] = None
         if isinstance(image, (str, Path)):
             image_path = Path(image)
-            loaded = self._image_loader.load(image_path)
+            loaded = self._image_loader.load_grayscale(image_path)
             if loaded is None:
                 return CornerDetectionResult(
                     success=False,
@@ -141,10 +146,7 @@ class CornerDetector:
             gray = image
 
         # Detect corners
-        pattern_size = self.config.pattern_size
-        success, corners = cv2.findChessboardCorners(
-            gray, pattern_size, flags=self.detection_flags
-        )
+        success, corners, downscaled = self._find_corners(gray)
 
         if not success or corners is None:
             logger.debug(f"Corner detection failed for: {image_path or 'array'}")
@@ -167,14 +169,18 @@ class CornerDetector:
                 error_message=f"Expected {expected_corners} corners, found {len(corners)}",
             )
 
-        # Refine corners with subpixel accuracy
-        if self.refine_corners:
-            corners = cv2.cornerSubPix(
-                gray,
-                corners,
-                self.SUBPIX_WINDOW_SIZE,
-                self.SUBPIX_ZERO_ZONE,
-                self.SUBPIX_CRITERIA,
+        # Refine corners with subpixel accuracy (always needed after a
+        # downscaled search, whose corners are only accurate to a few pixels)
+        if self.refine_corners or downscaled:
+            corners = np.asarray(
+                cv2.cornerSubPix(
+                    gray,
+                    corners,
+                    self.SUBPIX_WINDOW_SIZE,
+                    self.SUBPIX_ZERO_ZONE,
+                    self.SUBPIX_CRITERIA,
+                ),
+                dtype=np.float32,
             )
 
         logger.debug(f"Detected {len(corners)} corners in: {image_path or 'array'}")
@@ -186,6 +192,42 @@ class CornerDetector:
             image_size=image_size,
         )
 
+    def _find_corners(
+        self, gray: NDArray
+    ) -> tuple[bool, Optional[NDArray[np.float32]], bool]:
+        """Run findChessboardCorners, on a pyramid level for large images.
+
+        Returns:
+            (success, corners in full-resolution pixels, whether the search
+            ran on a downscaled image).
+        """
+        pattern_size = self.config.pattern_size
+
+        small = gray
+        factor = 1
+        while max(small.shape[:2]) >= self.DETECTION_MAX_DIM:
+            small = cv2.resize(
+                small, None, fx=0.5, fy=0.5, interpolation=cv2.INTER_AREA
+            )
+            factor *= 2
+
+        corners: Optional[NDArray[np.float32]]
+        if factor > 1:
+            success, found = cv2.findChessboardCorners(
+                small, pattern_size, flags=self.detection_flags
+            )
+            if success and found is not None:
+                # Map pixel centres from the pyramid level back to full resolution
+                corners = ((found + 0.5) * factor - 0.5).astype(np.float32, copy=False)
+                return True, corners, True
+
+        # Small images, or boards too fine to resolve at the reduced size
+        success, found = cv2.findChessboardCorners(
+            gray, pattern_size, flags=self.detection_flags
+        )
+        corners = None if found is None else np.asarray(found, dtype=np.float32)
+        return bool(success), corners, False
+
     def detect_batch(
         self,
         images: list[Union[str, Path, NDArray]],
@@ -256,18 +298,21 @@ class CornerDetector:
         Returns:
             Image with visualization.
         """
-        # Load image if needed
+        # Load image if needed; a freshly decoded image is ours to draw on,
+        # otherwise draw on a single copy of the caller's array
         if isinstance(image, (str, Path)):
             loaded = self._image_loader.load(image)
             if loaded is None:
                 raise CornerDetectionError(f"Failed to load image: {image}")
-            image = loaded
-
-        output = image.copy()
+            output = loaded
+        else:
+            output = image.copy()
 
         if result.success and result.corners is not None:
-            # Draw corners
-            output = self.draw_corners(output, result.corners, True)
+            # Draw corners in place (draw_corners would copy the image again)
+            cv2.drawChessboardCorners(
+                output, self.config.pattern_size, result.corners, True
+            )
 
             # Add corner indices
             corners_2d = result.get_corners_2d()
@@ -7,23 +7,107 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Optional, Tuple
 
 import cv2
 import numpy as np
 
+from vision_calib.core.corner_detector import CornerDetector
 from vision_calib.core.types import (
     CalibrationError,
     CameraExtrinsic,
     CameraIntrinsic,
     CheckerboardConfig,
 )
-from vision_calib.io.image_loader import ImageLoader
 from vision_calib.utils.logging import get_logger
 
 logger = get_logger("core.extrinsic")
 
+# solvePnP 結果快取的最大筆數
+_PNP_CACHE_SIZE = 32
+
+# solvePnP 結果快取（LRU），輸入未變時重新計算外參不重跑 solvePnP/projectPoints
+# {(K, D, 世界座標, 像素座標, PnP 旗標): (rvec, tvec, 重投影誤差)}
+_pnp_cache: OrderedDict = OrderedDict()
+
+
+def reprojection_rms(observed: np.ndarray, projected: np.ndarray) -> float:
+    """
+    計算重投影誤差 (RMS)
+
+    Args:
+        observed: 觀測到的像素座標 (N, 2)
+        projected: 重投影的像素座標 (N, 2)
+
+    Returns:
+        RMS 誤差 (pixels)
+    """
+    # 平方、加總與平均在 einsum 中一次完成，不產生中間陣列
+    diff = observed.reshape(-1, 2) - projected.reshape(-1, 2)
+    return float(np.sqrt(np.einsum("ij,ij->", diff, diff) / len(diff)))
+
+
+def solve_pnp(
+    object_points: np.ndarray,
+    image_points: np.ndarray,
+    intrinsic: CameraIntrinsic,
+    method: int = cv2.SOLVEPNP_ITERATIVE,
+) -> Optional[Tuple[np.ndarray, np.ndarray, float]]:
+    """
+    執行 solvePnP 並計算重投影誤差，相同輸入直接取用快取
+
+    Args:
+        object_points: 世界座標點 (N, 3) float32
+        image_points: 像素座標點 (N, 2) float32
+        intrinsic: 相機內參
+        method: solvePnP 方法
+
+    Returns:
+        (rvec, tvec, error)，計算失敗時回傳 None
+    """
+    camera_matrix = intrinsic.camera_matrix
+    dist_coeffs = intrinsic.distortion_coeffs
+
+    key = (
+        np.ascontiguousarray(camera_matrix).tobytes(),
+        np.ascontiguousarray(dist_coeffs).tobytes(),
+        np.ascontiguousarray(object_points).tobytes(),
+        np.ascontiguousarray(image_points).tobytes(),
+        method,
+    )
+    cached = _pnp_cache.get(key)
+    if cached is not None:
+        _pnp_cache.move_to_end(key)
+        rvec, tvec, error = cached
+        return rvec.copy(), tvec.copy(), error
+
+    success, rvec, tvec = cv2.solvePnP(
+        object_points,
+        image_points,
+        camera_matrix,
+        dist_coeffs,
+        flags=method,
+    )
+    if not success:
+        return None
+
+    # 計算重投影誤差
+    projected, _ = cv2.projectPoints(
+        object_points,
+        rvec,
+        tvec,
+        camera_matrix,
+        dist_coeffs,
+    )
+    error = reprojection_rms(image_points, projected)
+
+    _pnp_cache[key] = (rvec.copy(), tvec.copy(), error)
+    if len(_pnp_cache) > _PNP_CACHE_SIZE:
+        _pnp_cache.popitem(last=False)
+    return rvec, tvec, error
+
 
 @dataclass
 class ExtrinsicCalibrationResult:
@@ -104,9 +188,11 @@ class ExtrinsicCalibrator:
         self.intrinsic = intrinsic
         self.checkerboard = checkerboard
 
-        # 生成世界座標點 (Z=0 平面)
+        # 生成世界座標點 (Z=0 平面)，已是連續的 (N, 3) float32，每次標定直接沿用
         self.object_points = checkerboard.generate_object_points()
 
+        self._corner_detector = CornerDetector(checkerboard)
+
     def calibrate(
         self,
         image_path: str,
@@ -134,32 +220,36 @@ class ExtrinsicCalibrator:
         if corners is None:
             raise CalibrationError(f"無法在圖像中偵測到角點: {image_path}")
 
-        # 確保角點格式正確
-        image_points = corners.reshape(-1, 2).astype(np.float32)
-        object_points = self.object_points.reshape(-1, 3).astype(np.float32)
-
-        # 執行 solvePnP
-        success, rvec, tvec = cv2.solvePnP(
-            object_points,
-            image_points,
-            self.intrinsic.camera_matrix,
-            self.intrinsic.distortion_coeffs,
-            flags=method,
-        )
+        # 確保角點格式正確（已是 float32 時不複製）
+        image_points = np.ascontiguousarray(corners.reshape(-1, 2), dtype=np.float32)
+        return self.calibrate_points(self.object_points, image_points, image_path, method)
 
-        if not success:
-            raise CalibrationError("solvePnP 失敗")
+    def calibrate_points(
+        self,
+        object_points: np.ndarray,
+        image_points: np.ndarray,
+        source: str = "",
+        method: int = cv2.SOLVEPNP_ITERATIVE,
+    ) -> ExtrinsicCalibrationResult:
+        """
+        以任意世界/像素對應點執行外參標定
 
-        # 計算重投影誤差
-        reprojected, _ = cv2.projectPoints(
-            object_points,
-            rvec,
-            tvec,
-            self.intrinsic.camera_matrix,
-            self.intrinsic.distortion_coeffs,
-        )
-        reprojected = reprojected.reshape(-1, 2)
-        error = np.sqrt(np.mean(np.sum((image_points - reprojected) ** 2, axis=1)))
+        Args:
+            object_points: 世界座標點 (N, 3) float32
+            image_points: 像素座標點 (N, 2) float32
+            source: 點位來源（圖像路徑或點位來源名稱），記錄於結果的 image_path
+            method: solvePnP 方法
+
+        Returns:
+            ExtrinsicCalibrationResult 外參標定結果
+
+        Raises:
+            CalibrationError: 標定失敗
+        """
+        solved = solve_pnp(object_points, image_points, self.intrinsic, method)
+        if solved is None:
+            raise CalibrationError("solvePnP 失敗")
+        rvec, tvec, error = solved
 
         # 建立結果
         extrinsic = CameraExtrinsic(
@@ -170,7 +260,7 @@ class ExtrinsicCalibrator:
         result = ExtrinsicCalibrationResult(
             extrinsic=extrinsic,
             reprojection_error=error,
-            image_path=image_path,
+            image_path=source,
             num_points=len(image_points),
         )
 
@@ -178,28 +268,9 @@ class ExtrinsicCalibrator:
         return result
 
     def _detect_corners(self, image_path: str) -> Optional[np.ndarray]:
-        """偵測棋盤格角點"""
-        img = ImageLoader.load_grayscale(image_path)
-        if img is None:
-            return None
-
-        pattern_size = (self.checkerboard.cols, self.checkerboard.rows)
-        flags = (
-            cv2.CALIB_CB_ADAPTIVE_THRESH
-            | cv2.CALIB_CB_NORMALIZE_IMAGE
-            | cv2.CALIB_CB_FAST_CHECK
-        )
-
-        found, corners = cv2.findChessboardCorners(img, pattern_size, flags)
-
-        if not found:
-            return None
-
-        # 亞像素精化
-        criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 30, 0.001)
-        corners = cv2.cornerSubPix(img, corners, (11, 11), (-1, -1), criteria)
-
-        return corners
+        """偵測棋盤格角點（與內參標定共用 CornerDetector 的旗標與亞像素精化參數）"""
+        result = self._corner_detector.detect(image_path)
+        return result.corners if result.success else None
 
     def calibrate_multi_pose(
         self,
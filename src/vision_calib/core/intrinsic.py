@@ -16,6 +16,7 @@ import numpy as np
 from numpy.typing import NDArray
 
 from vision_calib.core.types import (
+    CalibrationCancelledError,
     CalibrationResult,
     CameraIntrinsic,
     CheckerboardConfig,
@@ -28,11 +29,17 @@ from vision_calib.utils.logging import get_logger
 
 logger = get_logger("core.intrinsic")
 
-
 # Minimum number of images required for calibration
 MIN_IMAGES_FOR_CALIBRATION = 3
 
 
+def _per_image_errors(observed, projected, offsets):
+    """Mean L2 reprojection error per image over concatenated point arrays."""
+    diff = observed - projected
+    sq = np.einsum("ij,ij->i", diff, diff)
+    return np.sqrt(np.add.reduceat(sq, offsets[:-1])) / np.diff(offsets)
+
+
 @dataclass
 class IntrinsicCalibrationConfig:
     """Configuration for intrinsic calibration.
@@ -116,12 +123,29 @@ class IntrinsicCalibrator:
         Returns:
             CornerDetectionResult indicating success/failure.
         """
-        result = self._corner_detector.detect(image)
+        return self.add_detection(self._corner_detector.detect(image))
+
+    def add_detection(self, result: CornerDetectionResult) -> CornerDetectionResult:
+        """Add an already computed corner detection result.
+
+        Lets callers run detection elsewhere (e.g. on a thread pool) and
+        feed results in image order.
+
+        Args:
+            result: Detection result for a checkerboard image.
+
+        Returns:
+            The same CornerDetectionResult.
+        """
         self._detection_results.append(result)
 
         if result.success and result.corners is not None:
             self._object_points.append(self._objp)
-            self._image_points.append(result.corners)
+            # calibrateCamera needs contiguous float32 points; detector output
+            # already is, so this only copies externally supplied corners
+            self._image_points.append(
+                np.ascontiguousarray(result.corners, dtype=np.float32)
+            )
 
             # Set image size from first successful detection
             if self._image_size is None:
@@ -195,6 +219,7 @@ class IntrinsicCalibrator:
 
         Args:
             progress_callback: Optional callback(current, total, message).
+                A truthy return value cancels calibration at the next step.
 
         Returns:
             CalibrationResult with intrinsic parameters.
@@ -202,6 +227,7 @@ class IntrinsicCalibrator:
         Raises:
             InsufficientImagesError: If not enough valid images.
             CornerDetectionError: If no corners were detected.
+            CalibrationCancelledError: If the progress callback asked to stop.
         """
         if not self.can_calibrate:
             raise InsufficientImagesError(
@@ -212,8 +238,8 @@ class IntrinsicCalibrator:
         if self._image_size is None:
             raise CornerDetectionError("No image size available (no successful detections)")
 
-        if progress_callback:
-            progress_callback(0, 100, "Starting calibration...")
+        if progress_callback and progress_callback(0, 100, "Starting calibration..."):
+            raise CalibrationCancelledError("Calibration cancelled")
 
         logger.info(
             f"Starting calibration with {self.num_valid_images} images, "
@@ -223,8 +249,8 @@ class IntrinsicCalibrator:
         # Get calibration flags
         flags = self.config.get_calibration_flags()
 
-        if progress_callback:
-            progress_callback(10, 100, "Running OpenCV calibration...")
+        if progress_callback and progress_callback(10, 100, "Running OpenCV calibration..."):
+            raise CalibrationCancelledError("Calibration cancelled")
 
         # Run OpenCV calibration
         ret, camera_matrix, dist_coeffs, rvecs, tvecs = cv2.calibrateCamera(
@@ -236,23 +262,27 @@ class IntrinsicCalibrator:
             flags=flags,
         )
 
-        if progress_callback:
-            progress_callback(80, 100, "Computing per-image errors...")
+        if progress_callback and progress_callback(80, 100, "Computing per-image errors..."):
+            raise CalibrationCancelledError("Calibration cancelled")
 
         # Compute per-image reprojection errors
-        per_image_errors = []
-        for i in range(len(self._object_points)):
-            projected, _ = cv2.projectPoints(
+        projected = [
+            cv2.projectPoints(
                 self._object_points[i],
                 rvecs[i],
                 tvecs[i],
                 camera_matrix,
                 dist_coeffs,
-            )
-            error = cv2.norm(
-                self._image_points[i], projected, cv2.NORM_L2
-            ) / len(projected)
-            per_image_errors.append(error)
+            )[0]
+            for i in range(len(self._object_points))
+        ]
+        offsets = np.zeros(len(projected) + 1, dtype=np.int64)
+        np.cumsum([len(p) for p in projected], out=offsets[1:])
+        per_image_errors = _per_image_errors(
+            np.concatenate(self._image_points, dtype=np.float64).reshape(-1, 2),
+            np.concatenate(projected, dtype=np.float64).reshape(-1, 2),
+            offsets,
+        ).tolist()
 
         if progress_callback:
             progress_callback(100, 100, "Calibration complete")
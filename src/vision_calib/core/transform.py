@@ -17,11 +17,59 @@ from typing import Optional, Tuple, Union
 import cv2
 import numpy as np
 
+from vision_calib.core._jit import optional_njit
 from vision_calib.core.types import CameraExtrinsic, CameraIntrinsic
 from vision_calib.utils.logging import get_logger
 
 logger = get_logger("core.transform")
 
+# 點數達此門檻才使用 numba 核心（選用相依 ``speedups`` extra，第一次用到時才載入）；
+# 單點點擊轉換等少量點直接以 NumPy 計算，免除 JIT 編譯與核心呼叫開銷
+_JIT_MIN_POINTS = 1024
+
+
+def _intersect_plane_numpy(normalized, R_inv, camera_pos, z_world):
+    """歸一化座標的射線與 Z=z_world 平面求交"""
+    # 射線 [x, y, 1] 旋轉到世界座標：R_inv[:, :2] @ [x, y] + R_inv[:, 2]
+    rays = normalized @ R_inv[:, :2].T + R_inv[:, 2]
+    t = (z_world - camera_pos[2]) / rays[:, 2]
+    return camera_pos + t[:, np.newaxis] * rays
+
+
+def _intersect_plane_loop(normalized, R_inv, camera_pos, z_world):
+    """歸一化座標的射線與 Z=z_world 平面求交（逐點融合旋轉與求交，供 numba 編譯）"""
+    n = normalized.shape[0]
+    out = np.empty((n, 3))
+    for i in range(n):
+        x = normalized[i, 0]
+        y = normalized[i, 1]
+        rx = R_inv[0, 0] * x + R_inv[0, 1] * y + R_inv[0, 2]
+        ry = R_inv[1, 0] * x + R_inv[1, 1] * y + R_inv[1, 2]
+        rz = R_inv[2, 0] * x + R_inv[2, 1] * y + R_inv[2, 2]
+        t = (z_world - camera_pos[2]) / rz
+        out[i, 0] = camera_pos[0] + t * rx
+        out[i, 1] = camera_pos[1] + t * ry
+        out[i, 2] = camera_pos[2] + t * rz
+    return out
+
+
+def _intersect_plane(
+    normalized: np.ndarray,
+    R_inv: np.ndarray,
+    camera_pos: np.ndarray,
+    z_world: float,
+) -> np.ndarray:
+    """歸一化座標的射線與 Z=z_world 平面求交（大量點且有 numba 時使用編譯核心）"""
+    result: np.ndarray
+    kernel = None
+    if normalized.shape[0] >= _JIT_MIN_POINTS:
+        kernel = optional_njit(_intersect_plane_loop)
+    if kernel is not None:
+        result = kernel(normalized, R_inv, camera_pos, z_world)
+    else:
+        result = _intersect_plane_numpy(normalized, R_inv, camera_pos, z_world)
+    return result
+
 
 @dataclass
 class TransformResult:
@@ -63,6 +111,7 @@ class CoordinateTransformer:
             self._R = extrinsic.rotation_matrix
             self._R_inv = self._R.T
             self._t = extrinsic.translation_vector.reshape(3, 1)
+            self._camera_pos = -self._R_inv @ self._t
 
     def set_extrinsic(self, extrinsic: CameraExtrinsic) -> None:
         """設置或更新外參"""
@@ -70,6 +119,7 @@ class CoordinateTransformer:
         self._R = extrinsic.rotation_matrix
         self._R_inv = self._R.T
         self._t = extrinsic.translation_vector.reshape(3, 1)
+        self._camera_pos = -self._R_inv @ self._t
 
     # ==================== 像素 ↔ 相機 ====================
 
@@ -259,27 +309,17 @@ class CoordinateTransformer:
         # 取得歸一化座標
         normalized = self.pixel_to_normalized(pts, undistort=True)
 
-        results = []
-        for norm_pt in normalized:
-            # 相機座標系中的射線方向 (Z=1 平面上的點)
-            ray_camera = np.array([norm_pt[0], norm_pt[1], 1.0])
-
-            # 轉換到世界座標系
-            # 射線起點: 相機位置 (世界座標)
-            camera_pos_world = -self._R_inv @ self._t
-
-            # 射線方向 (世界座標)
-            ray_world = self._R_inv @ ray_camera.reshape(3, 1)
-
-            # 與 Z = z_world 平面求交
-            # camera_pos + t * ray_dir = [x, y, z_world]
-            # 解: t = (z_world - camera_pos[2]) / ray_dir[2]
-            t_param = (z_world - camera_pos_world[2, 0]) / ray_world[2, 0]
-
-            intersection = camera_pos_world + t_param * ray_world
-            results.append(intersection.flatten())
-
-        result = np.array(results)
+        # 相機座標系中的射線方向為 Z=1 平面上的點 [x, y, 1]，
+        # 轉到世界座標系後從相機位置（設定外參時預先計算）出發，
+        # 與 Z = z_world 平面求交：
+        # camera_pos + t * ray_dir = [x, y, z_world]
+        # 解: t = (z_world - camera_pos[2]) / ray_dir[2]
+        result = _intersect_plane(
+            np.ascontiguousarray(normalized, dtype=np.float64),
+            np.ascontiguousarray(self._R_inv),
+            self._camera_pos.ravel(),
+            float(z_world),
+        )
 
         if single_point:
             return result[0]
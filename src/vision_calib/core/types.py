@@ -16,10 +16,13 @@ import numpy as np
 from numpy.typing import NDArray
 
 
-@dataclass
+@dataclass(frozen=True)
 class CheckerboardConfig:
     """Configuration for checkerboard calibration target.
 
+    Instances are immutable and hashable, so a single config can be shared
+    between detectors and calibrators and used as a cache key.
+
     Attributes:
         rows: Number of inner corners in the vertical direction.
         cols: Number of inner corners in the horizontal direction.
@@ -57,10 +60,13 @@ class CheckerboardConfig:
         Returns:
             Array of shape (rows*cols, 3) with Z=0 for all points.
         """
-        objp = np.zeros((self.num_corners, 3), dtype=np.float32)
-        objp[:, :2] = np.mgrid[0:self.cols, 0:self.rows].T.reshape(-1, 2)
-        objp *= self.square_size_mm
-        return objp
+        # Broadcast the column (x) and row (y) offsets straight into a
+        # (rows, cols, 3) grid; row-major order matches OpenCV's corner order.
+        objp = np.zeros((self.rows, self.cols, 3), dtype=np.float32)
+        step = np.float32(self.square_size_mm)
+        objp[..., 0] = np.arange(self.cols, dtype=np.float32) * step
+        objp[..., 1] = np.arange(self.rows, dtype=np.float32)[:, np.newaxis] * step
+        return objp.reshape(-1, 3)
 
 
 @dataclass
@@ -306,6 +312,11 @@ class CornerDetectionError(CalibrationError):
     pass
 
 
+class CalibrationCancelledError(CalibrationError):
+    """Raised when a progress callback requests that calibration stop."""
+    pass
+
+
 class InvalidParameterError(CalibrationError):
     """Raised when invalid parameters are provided."""
     pass
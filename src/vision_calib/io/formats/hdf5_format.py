@@ -10,7 +10,6 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Union
 
-import h5py
 import numpy as np
 
 from vision_calib.core.types import (
@@ -84,6 +83,8 @@ class HDF5Format:
 
         logger.info(f"Saving calibration to HDF5: {path}")
 
+        import h5py
+
         with h5py.File(path, "w") as f:
             # File-level attributes
             f.attrs["format_version"] = cls.VERSION
@@ -167,6 +168,8 @@ class HDF5Format:
 
         logger.info(f"Loading calibration from HDF5: {path}")
 
+        import h5py
+
         with h5py.File(path, "r") as f:
             # Verify format
             format_type = f.attrs.get("format_type", "")
@@ -255,6 +258,8 @@ class HDF5Format:
             return False
 
         try:
+            import h5py
+
             with h5py.File(path, "r") as f:
                 return "intrinsic" in f and "camera_matrix" in f["intrinsic"]
         except (OSError, KeyError):
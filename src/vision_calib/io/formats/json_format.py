@@ -109,7 +109,17 @@ class JSONFormat:
 
         logger.info(f"Saving calibration to JSON: {path}")
 
-        # Build data dictionary
+        data = cls._to_dict(result)
+
+        # Write file
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=indent, ensure_ascii=ensure_ascii, cls=NumpyEncoder)
+
+        logger.info(f"Saved calibration to: {path}")
+
+    @classmethod
+    def _to_dict(cls, result: CalibrationResult) -> dict[str, Any]:
+        """Build the JSON-serializable dictionary for a calibration result."""
         data: dict[str, Any] = {
             "format_version": cls.VERSION,
             "format_type": "vision-calib",
@@ -153,11 +163,7 @@ class JSONFormat:
         if result.per_image_errors is not None:
             data["per_image_errors"] = result.per_image_errors
 
-        # Write file
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=indent, ensure_ascii=ensure_ascii, cls=NumpyEncoder)
-
-        logger.info(f"Saved calibration to: {path}")
+        return data
 
     @classmethod
     def load(cls, path: Union[str, Path]) -> CalibrationResult:
@@ -282,19 +288,6 @@ class JSONFormat:
         Returns:
             JSON string representation.
         """
-        import io
-        from pathlib import Path
-        import tempfile
-
-        # Use save to generate the dict, then serialize
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            temp_path = Path(f.name)
-
-        cls.save(temp_path, result, indent=indent)
-
-        with open(temp_path, "r", encoding="utf-8") as f:
-            json_str = f.read()
-
-        temp_path.unlink()  # Clean up temp file
-
-        return json_str
+        return json.dumps(
+            cls._to_dict(result), indent=indent, ensure_ascii=False, cls=NumpyEncoder
+        )
@@ -11,7 +11,6 @@ from pathlib import Path
 from typing import Any, Union
 
 import numpy as np
-import scipy.io as sio
 
 from vision_calib.core.types import (
     CalibrationResult,
@@ -115,6 +114,8 @@ class MATFormat:
 
         # Save file
         # Note: do_compression=True is only supported for format 7.3 (HDF5-based)
+        import scipy.io as sio
+
         sio.savemat(path, mdict, do_compression=True)
 
         logger.info(f"Saved calibration to: {path}")
@@ -139,6 +140,8 @@ class MATFormat:
 
         logger.info(f"Loading calibration from MAT: {path}")
 
+        import scipy.io as sio
+
         try:
             # Load MAT file
             # squeeze_me=True: Convert single-element arrays to scalars
@@ -244,6 +247,8 @@ class MATFormat:
             return False
 
         try:
+            import scipy.io as sio
+
             data = sio.loadmat(path, squeeze_me=True)
             return "camera_matrix" in data and "distortion_coeffs" in data
         except Exception:
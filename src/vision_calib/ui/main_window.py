@@ -8,10 +8,11 @@
 from __future__ import annotations
 
 import sys
+import time
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import Qt, QSize, Signal, Slot, QThread, QMutex, QMutexLocker
+from PySide6.QtCore import Qt, QAbstractTableModel, QEvent, QSize, Signal, Slot, QThread, QMutex, QMutexLocker, QTimer
 from PySide6.QtGui import QAction, QIcon, QFont, QImage
 from PySide6.QtWidgets import (
     QApplication,
@@ -40,6 +41,106 @@ from vision_calib.utils.logging import get_logger, setup_logging
 
 logger = get_logger("ui.main_window")
 
+# 點位數據欄位（與 _point_data 的欄順序一致）
+_POINT_FIELDS = ("id", "image_x", "image_y", "world_x", "world_y")
+
+# 匯入點位 CSV 時各欄可接受的欄位名稱（依 _POINT_FIELDS 順序，前者優先）
+_POINT_CSV_ALIASES = (
+    ("id", "ID"),
+    ("image_x", "img_x", "x"),
+    ("image_y", "img_y", "y"),
+    ("world_x", "X"),
+    ("world_y", "Y"),
+)
+
+# PnP 算法選項 (顯示名稱, combo data)，combo data 即 cv2 的 solvePnP 旗標名稱
+_PNP_ALGORITHMS = (
+    ("PnP 迭代法 (≥4點, 推薦)", "SOLVEPNP_ITERATIVE"),
+    ("EPnP 算法 (≥4點, 高效)", "SOLVEPNP_EPNP"),
+    ("P3P 算法 (=3點)", "SOLVEPNP_P3P"),
+    ("AP3P 算法 (≥3點)", "SOLVEPNP_AP3P"),
+    ("IPPE 算法 (≥4點, 平面)", "SOLVEPNP_IPPE"),
+    ("IPPE_SQUARE (≥4點, 正方形)", "SOLVEPNP_IPPE_SQUARE"),
+    ("SQPnP 算法 (≥3點, 全域最佳)", "SOLVEPNP_SQPNP"),
+)
+
+# PnP 算法說明 {combo data: 說明文字}
+_PNP_DESCRIPTIONS = {
+    "SOLVEPNP_ITERATIVE": "迭代法：最通用，適合大多數情況，需≥4個點",
+    "SOLVEPNP_EPNP": "EPnP：高效率算法，點數較多(>10)時推薦，需≥4個點",
+    "SOLVEPNP_P3P": "P3P：只需剛好3個點，可能有多解，適合點數極少的情況",
+    "SOLVEPNP_AP3P": "AP3P：P3P改進版，數值穩定性更好，需≥3個點",
+    "SOLVEPNP_IPPE": "IPPE：專為平面物體設計，適合棋盤格等平面標定，需≥4個點",
+    "SOLVEPNP_IPPE_SQUARE": "IPPE_SQUARE：IPPE改進版，專為正方形標定板優化，需≥4個點",
+    "SOLVEPNP_SQPNP": "SQPnP：全域最佳解，不需初始值，點數多時仍快速穩定，需≥3個點",
+}
+
+# PnP 算法的最少點數與顯示名稱 {combo data: (min_points, name)}，未列出者為一般 PnP
+_PNP_MIN_POINTS = {
+    "SOLVEPNP_P3P": (3, "P3P"),
+    "SOLVEPNP_AP3P": (3, "AP3P"),
+    "SOLVEPNP_SQPNP": (3, "SQPnP"),
+}
+_PNP_DEFAULT_MIN_POINTS = (4, "PnP")
+
+# 狀態標籤樣式（未滿足條件 / 已就緒）
+_STATUS_ERROR_STYLE = "color: #ea4335;"
+_STATUS_OK_STYLE = "color: #34a853;"
+
+
+def _parse_point_csv(lines):
+    """解析點位 CSV 的文字行（第一行為表頭），回傳 (N, 5) 點位數據
+
+    支持多種欄位名稱（見 _POINT_CSV_ALIASES）：只在表頭解析一次欄位位置，
+    數值再由 np.loadtxt 一次整批解析，不逐列建立 dict 與 float。
+    缺少的欄位：ID 依序編號，座標補 0。
+    """
+    import csv
+    import numpy as np
+
+    header = next(csv.reader(lines[:1]), [])
+    body = lines[1:]
+
+    columns = []
+    for aliases in _POINT_CSV_ALIASES:
+        index = next((header.index(a) for a in aliases if a in header), None)
+        columns.append(index)
+    usecols = sorted({c for c in columns if c is not None})
+
+    if not any(line.strip() for line in body):
+        values = np.empty((0, len(usecols)))
+    elif usecols:
+        # ndmin=2：只有一列數據時 loadtxt 仍回傳 (1, K) 而非一維陣列
+        values = np.loadtxt(
+            body, delimiter=',', quotechar='"', usecols=usecols, ndmin=2,
+        )
+    else:
+        values = np.empty((sum(1 for line in body if line.strip()), 0))
+    count = len(values)
+
+    rows = np.zeros((count, 5), dtype=np.float64)
+    rows[:, 0] = np.arange(1, count + 1)
+    for i, column in enumerate(columns):
+        if column is not None:
+            rows[:, i] = values[:, usecols.index(column)]
+    return rows
+
+
+def _points_to_structured(points):
+    """將 (N, 5) 點位數據轉為以 _POINT_FIELDS 命名的結構化陣列
+
+    ID 以 int32 保存，下游可直接依欄位名稱讀取。
+    """
+    import numpy as np
+
+    dtype = np.dtype(
+        [(_POINT_FIELDS[0], '<i4')] + [(name, '<f8') for name in _POINT_FIELDS[1:]]
+    )
+    data = np.empty(len(points), dtype=dtype)
+    for i, name in enumerate(_POINT_FIELDS):
+        data[name] = points[:, i]
+    return data
+
 
 class ImageViewer(QLabel):
     """
@@ -57,6 +158,12 @@ class ImageViewer(QLabel):
     mouse_moved = Signal(float, float)  # 滑鼠移動 (image_x, image_y)
     mouse_left = Signal()  # 滑鼠離開
 
+    # 標記點十字線的半長（像素）；標籤畫在十字線右上方
+    _CROSS_SIZE = 12
+
+    # 拖曳/滾輪重繪的最短間隔（約 60 fps）
+    REDRAW_INTERVAL = 0.016  # 秒
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAlignment(Qt.AlignCenter)
@@ -95,9 +202,47 @@ class ImageViewer(QLabel):
         # 模式
         self._interactive = False  # 是否允許交互（拍照後才允許）
 
+        # 標記點繪製用的畫筆與字型，建立一次供每次重繪共用
+        from PySide6.QtGui import QPen, QColor, QFont, QFontMetrics
+        self._marker_pen = QPen(QColor(255, 50, 50), 2)
+        self._label_pen = QPen(QColor(255, 255, 0))
+        self._label_font = QFont("Arial", 11, QFont.Bold)
+        self._label_metrics = QFontMetrics(self._label_font)
+        self._label_ascent = self._label_metrics.ascent()
+
+        # 標籤文字排版快取（名稱 -> QStaticText）：標籤只在標記點變動時改變，
+        # 平移縮放重繪時直接貼上已排版的文字，不必每次重新排版
+        self._label_cache = {}
+
+        # 已縮放圖像快取：拖曳平移時縮放比例不變，每次移動只需貼上
+        # 快取的圖像並重繪標記點，不必重新平滑縮放整張原圖
+        self._scaled_pixmap = None
+        self._scaled_key = None  # (pixmap cacheKey, scaled_w, scaled_h)
+        self._scaled_smooth = False  # 快取是否為平滑縮放結果
+
+        # 圖像與標記點的合成快取（類似 blit 的背景快取）：平移時只貼上
+        # 這張圖；縮放結果或標記點改變時才重建
+        self._overlay_pixmap = None
+        self._overlay_key = None  # (_scaled_key, _scaled_smooth, _points_version)
+        self._points_version = 0
+        # 十字線與標籤超出圖像範圍的繪製邊距（像素），依最長標籤寬度計算
+        self._overlay_margin = self._marker_margin()
+
+        # 連續滾輪縮放時每一格都要重新縮放整張原圖，期間改用快速縮放預覽，
+        # 停止滾動一段時間後再以平滑縮放重繪一次
+        self._zooming = False
+        self._settle_timer = QTimer(self)
+        self._settle_timer.setSingleShot(True)
+        self._settle_timer.setInterval(150)
+        self._settle_timer.timeout.connect(self._on_zoom_settled)
+
+        # 拖曳/滾輪事件只排程重繪，同一輪事件迴圈內的多次移動合併為一次，
+        # 且距上次重繪不足 REDRAW_INTERVAL 時延後到間隔結束
+        self._redraw_pending = False
+        self._last_redraw = 0.0
+
     def set_image(self, pixmap, interactive: bool = False):
         """設置要顯示的圖像"""
-        from PySide6.QtGui import QPixmap
         self._pixmap = pixmap
         if pixmap:
             self._image_width = pixmap.width()
@@ -108,8 +253,28 @@ class ImageViewer(QLabel):
     def set_points(self, points: list):
         """設置標記點列表"""
         self._points = points
+        self._points_version += 1
+        # 只保留目前名稱的排版快取，改名或刪除的點在下次繪製時重建
+        names = {point['name'] for point in points}
+        self._label_cache = {
+            name: text for name, text in self._label_cache.items() if name in names
+        }
+        self._overlay_margin = self._marker_margin()
         self._update_display()
 
+    def _marker_margin(self):
+        """十字線、圓圈與標籤超出標記點位置的最大距離（像素）"""
+        longest = max(
+            (self._label_metrics.horizontalAdvance(point['name']) for point in self._points),
+            default=0,
+        )
+        # 標籤左緣在十字線右方 12 px、基線在上方 5 px；另留畫筆寬度
+        return max(
+            self._CROSS_SIZE,
+            12 + longest,
+            5 + self._label_ascent,
+        ) + 2
+
     def reset_view(self):
         """重置視圖（適應窗口）"""
         self._scale = 1.0
@@ -117,11 +282,40 @@ class ImageViewer(QLabel):
         self._offset_y = 0.0
         self._update_display()
 
+    def _schedule_update(self):
+        """排程重繪一次（觸控板等高頻事件下最多約每 16 ms 一次）"""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            wait = self.REDRAW_INTERVAL - (time.monotonic() - self._last_redraw)
+            QTimer.singleShot(max(0, int(wait * 1000)), self._do_scheduled_update)
+
+    def _do_scheduled_update(self):
+        """執行排程的重繪"""
+        self._redraw_pending = False
+        self._last_redraw = time.monotonic()
+        self._update_display()
+
+    def _on_zoom_settled(self):
+        """縮放停止，以平滑縮放重繪"""
+        self._zooming = False
+        self._update_display()
+
     def _update_display(self):
-        """更新顯示"""
-        from PySide6.QtGui import QPixmap, QPainter, QPen, QColor, QFont
+        """更新顯示（實際繪製在 paintEvent 中進行）"""
+        if self._pixmap is not None:
+            self.update()
+
+    def paintEvent(self, event):
+        """直接在元件上繪製圖像與標記點
+
+        平移與縮放只需重繪元件本身，不必每次另建整個視窗大小的
+        pixmap 再經 setPixmap 交給 QLabel。尚未設定圖像時沿用
+        QLabel 的繪製（串流畫面或提示文字）。
+        """
+        from PySide6.QtGui import QPainter, QColor, QPixmap
 
         if self._pixmap is None:
+            super().paintEvent(event)
             return
 
         # 計算適應窗口的基礎縮放
@@ -136,47 +330,114 @@ class ImageViewer(QLabel):
         scaled_w = int(self._image_width * total_scale)
         scaled_h = int(self._image_height * total_scale)
 
-        # 創建顯示用的 pixmap
-        display = QPixmap(label_w, label_h)
-        display.fill(QColor("#1a1a1a"))
-
-        painter = QPainter(display)
-        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        # 邊框沿用樣式表（QFrame 的繪製），圖像限制在內容區域內
+        QFrame.paintEvent(self, event)
+        painter = QPainter(self)
+        painter.setClipRect(self.contentsRect())
+        painter.fillRect(self.rect(), QColor("#1a1a1a"))
+        # 縮放或拖曳進行中只繪製快速預覽，結束後再平滑重繪
+        smooth = not (self._zooming or self._dragging)
+        if smooth:
+            painter.setRenderHint(QPainter.SmoothPixmapTransform)
 
         # 計算繪製位置（居中 + 偏移）
         draw_x = (label_w - scaled_w) / 2 + self._offset_x
         draw_y = (label_h - scaled_h) / 2 + self._offset_y
 
-        # 繪製圖像
-        painter.drawPixmap(
-            int(draw_x), int(draw_y), scaled_w, scaled_h,
-            self._pixmap
-        )
+        # 繪製圖像（縮放後不超過視窗數倍大小時使用快取，
+        # 放大過多時直接繪製以免快取佔用大量記憶體）
+        if scaled_w * scaled_h <= 4 * label_w * label_h:
+            key = (self._pixmap.cacheKey(), scaled_w, scaled_h)
+            # 平移時縮放比例不變，沿用已有的快取（平滑或快速皆可）
+            if key != self._scaled_key or (smooth and not self._scaled_smooth):
+                fast = self._zooming
+                self._scaled_pixmap = self._pixmap.scaled(
+                    scaled_w, scaled_h, Qt.IgnoreAspectRatio,
+                    Qt.FastTransformation if fast else Qt.SmoothTransformation
+                )
+                self._scaled_key = key
+                self._scaled_smooth = not fast
+
+            # 有標記點時，將縮放後的圖像與標記點合成一張快取圖（四周留出
+            # 十字線與標籤的邊距）；平移時只需貼上合成圖，不必逐點重繪。
+            # 連續縮放期間每步尺寸都不同，直接繪製標記點不建立合成圖
+            if self._interactive and self._points and not self._zooming:
+                margin = self._overlay_margin
+                overlay_key = (self._scaled_key, self._scaled_smooth, self._points_version)
+                if overlay_key != self._overlay_key:
+                    overlay = QPixmap(scaled_w + 2 * margin, scaled_h + 2 * margin)
+                    overlay.fill(QColor("#1a1a1a"))
+                    overlay_painter = QPainter(overlay)
+                    overlay_painter.drawPixmap(margin, margin, self._scaled_pixmap)
+                    self._draw_markers(
+                        overlay_painter, margin, margin, total_scale,
+                        overlay.width(), overlay.height(),
+                    )
+                    overlay_painter.end()
+                    self._overlay_pixmap = overlay
+                    self._overlay_key = overlay_key
+                painter.drawPixmap(
+                    int(draw_x) - margin, int(draw_y) - margin, self._overlay_pixmap
+                )
+                painter.end()
+                return
+
+            painter.drawPixmap(int(draw_x), int(draw_y), self._scaled_pixmap)
+        else:
+            painter.drawPixmap(
+                int(draw_x), int(draw_y), scaled_w, scaled_h,
+                self._pixmap
+            )
 
-        # 繪製標記點
         if self._interactive and self._points:
-            for i, point in enumerate(self._points):
-                # 轉換圖像座標到顯示座標
-                px = draw_x + point['pixel_x'] * total_scale
-                py = draw_y + point['pixel_y'] * total_scale
-
-                # 繪製十字線
-                pen = QPen(QColor(255, 50, 50), 2)
-                painter.setPen(pen)
-                cross_size = 12
-                painter.drawLine(int(px - cross_size), int(py), int(px + cross_size), int(py))
-                painter.drawLine(int(px), int(py - cross_size), int(px), int(py + cross_size))
-
-                # 繪製圓圈
-                painter.drawEllipse(int(px - 8), int(py - 8), 16, 16)
-
-                # 繪製標籤
-                painter.setFont(QFont("Arial", 11, QFont.Bold))
-                painter.setPen(QPen(QColor(255, 255, 0)))
-                painter.drawText(int(px + 12), int(py - 5), point['name'])
+            self._draw_markers(painter, draw_x, draw_y, total_scale, label_w, label_h)
 
         painter.end()
-        super().setPixmap(display)
+
+    def _draw_markers(self, painter, origin_x, origin_y, total_scale, width, height):
+        """以 origin 為圖像左上角，繪製落在 width × height 範圍內的標記點
+
+        先收集所有十字線與圓圈，一次以同一支畫筆繪出，再切換畫筆繪製
+        全部標籤，避免每個點來回切換畫筆與逐條繪製。
+        """
+        from PySide6.QtCore import QLineF, QPointF
+        from PySide6.QtGui import QPainterPath, QStaticText, QTransform
+
+        cross_size = self._CROSS_SIZE
+        # 只繪製落在範圍內（含十字線與標籤的邊距）的點，
+        # 放大檢視時畫面外的點不必建立圖形與排版文字
+        margin = self._overlay_margin
+        visible = []
+        for point in self._points:
+            # 轉換圖像座標到顯示座標
+            px = int(origin_x + point['pixel_x'] * total_scale)
+            py = int(origin_y + point['pixel_y'] * total_scale)
+            if -margin <= px <= width + margin and -margin <= py <= height + margin:
+                visible.append((px, py, point['name']))
+
+        # 十字線與圓圈
+        lines = []
+        circles = QPainterPath()
+        for px, py, _ in visible:
+            lines.append(QLineF(px - cross_size, py, px + cross_size, py))
+            lines.append(QLineF(px, py - cross_size, px, py + cross_size))
+            circles.addEllipse(px - 8, py - 8, 16, 16)
+        painter.setPen(self._marker_pen)
+        painter.drawLines(lines)
+        painter.drawPath(circles)
+
+        # 標籤
+        painter.setPen(self._label_pen)
+        painter.setFont(self._label_font)
+        for px, py, name in visible:
+            text = self._label_cache.get(name)
+            if text is None:
+                text = QStaticText(name)
+                text.setTextFormat(Qt.PlainText)
+                text.prepare(QTransform(), self._label_font)
+                self._label_cache[name] = text
+            # drawText 以基線定位，QStaticText 以左上角定位
+            painter.drawStaticText(QPointF(px + 12, py - 5 - self._label_ascent), text)
 
     def _display_to_image_coords(self, display_x: float, display_y: float):
         """將顯示座標轉換為圖像座標"""
@@ -201,13 +462,17 @@ class ImageViewer(QLabel):
         return None, None
 
     def _find_point_at(self, img_x: float, img_y: float):
-        """查找指定位置附近的點，返回索引或 -1"""
-        import math
+        """查找指定位置附近最近的點，返回索引或 -1"""
+        # 以距離平方比較，不必對每個點開根號；標記重疊時選取最靠近游標的點
+        best = -1
+        best_dist_sq = self._point_radius * self._point_radius
         for i, point in enumerate(self._points):
-            dist = math.sqrt((img_x - point['pixel_x'])**2 + (img_y - point['pixel_y'])**2)
-            if dist < self._point_radius:
-                return i
-        return -1
+            dx = img_x - point['pixel_x']
+            dy = img_y - point['pixel_y']
+            dist_sq = dx * dx + dy * dy
+            if dist_sq < best_dist_sq:
+                best, best_dist_sq = i, dist_sq
+        return best
 
     def mousePressEvent(self, event):
         """滑鼠按下"""
@@ -234,6 +499,7 @@ class ImageViewer(QLabel):
         if event.button() == Qt.RightButton:
             self._dragging = False
             self.setCursor(Qt.ArrowCursor)
+            self._update_display()
         super().mouseReleaseEvent(event)
 
     def mouseMoveEvent(self, event):
@@ -243,7 +509,7 @@ class ImageViewer(QLabel):
             delta = event.pos() - self._drag_start
             self._offset_x = self._drag_offset_start[0] + delta.x()
             self._offset_y = self._drag_offset_start[1] + delta.y()
-            self._update_display()
+            self._schedule_update()
         elif self._interactive:
             # 顯示座標
             img_x, img_y = self._display_to_image_coords(event.pos().x(), event.pos().y())
@@ -306,7 +572,9 @@ class ImageViewer(QLabel):
             self._offset_x = new_draw_x - (label_w - new_scaled_w) / 2
             self._offset_y = new_draw_y - (label_h - new_scaled_h) / 2
 
-            self._update_display()
+            self._zooming = True
+            self._settle_timer.start()
+            self._schedule_update()
 
         event.accept()
 
@@ -355,8 +623,6 @@ class WebCamWorker(QThread):
     def run(self):
         """執行緒主迴圈"""
         import cv2
-        import time
-        import numpy as np
 
         # 開啟相機
         self._cap = cv2.VideoCapture(self._cam_index, cv2.CAP_DSHOW)
@@ -405,8 +671,8 @@ class WebCamWorker(QThread):
             # 快速縮放（使用 INTER_NEAREST 最快）
             small = cv2.resize(frame, (preview_w, preview_h), interpolation=cv2.INTER_NEAREST)
 
-            # BGR 轉 RGB（使用 numpy 切片比 cvtColor 快）
-            rgb = small[:, :, ::-1].copy()
+            # BGR 轉 RGB（cvtColor 以 SIMD 一次完成，比 numpy 反向切片再複製快約十倍）
+            rgb = cv2.cvtColor(small, cv2.COLOR_BGR2RGB)
 
             # 創建 QImage（使用 copy() 確保數據獨立）
             q_img = QImage(
@@ -429,6 +695,49 @@ class WebCamWorker(QThread):
         self.wait(2000)
 
 
+class PointTableModel(QAbstractTableModel):
+    """
+    點位數據表格模型
+
+    直接讀取 (N, 5) 點位陣列 [id, image_x, image_y, world_x, world_y]，
+    視圖只向模型查詢可見範圍內的儲存格，不必為每個點建立表格項目，
+    匯入上千個點時更新表格為 O(1)。
+    """
+
+    HEADERS = ("ID", "像素X", "像素Y", "世界X", "世界Y")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._data = None
+
+    def set_points(self, data):
+        """設置點位陣列（整批重設視圖）"""
+        self.beginResetModel()
+        self._data = data
+        self.endResetModel()
+
+    def rowCount(self, parent=None):
+        if (parent is not None and parent.isValid()) or self._data is None:
+            return 0
+        return len(self._data)
+
+    def columnCount(self, parent=None):
+        return 0 if parent is not None and parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        value = float(self._data[index.row(), index.column()])
+        if index.column() == 0:
+            return str(int(value))
+        return f"{value:.2f}"
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
 class MainWindow(QMainWindow):
     """主應用程式視窗"""
 
@@ -448,25 +757,70 @@ class MainWindow(QMainWindow):
         # 背景工作執行緒
         self._corner_worker = None
         self._calib_worker = None
+        self._ext_corner_worker = None
+        self._excel_worker = None
 
         # 角點偵測結果快取 {image_path: corners}
         self._corner_cache: dict = {}
 
+        # 目前預覽圖像的解碼結果 (image_path, 縮小後的 BGR 圖, 縮放比例, 原始尺寸)，
+        # 角點更新時重繪疊加層即可，不必重新讀檔解碼
+        self._preview_base: Optional[tuple] = None
+        # 目前預覽畫面的內容 (image_path, corners, pattern_size)，內容未變時略過重繪
+        self._preview_state: Optional[tuple] = None
+
+        # 視窗縮放時的預覽重新適配：拖曳視窗邊框會連續觸發 resizeEvent，
+        # 合併為每畫面最多一次 fitInView
+        self._fit_timer = QTimer(self)
+        self._fit_timer.setSingleShot(True)
+        self._fit_timer.setInterval(16)
+        self._fit_timer.timeout.connect(self._fit_image_view)
+
+        # WebCAM 游標座標顯示：滑鼠移動每秒可觸發上百次，每次 setText 都會
+        # 使標籤重新計算尺寸與版面，改為暫存最新座標、每 30 ms 最多更新一次
+        self._coord_text = ""
+        self._coord_timer = QTimer(self)
+        self._coord_timer.setSingleShot(True)
+        self._coord_timer.setInterval(30)
+        self._coord_timer.timeout.connect(self._flush_coord_label)
+
+        # 棋盤格設定快取 {(rows, cols, square_size_mm): CheckerboardConfig}
+        self._checkerboard_configs: dict = {}
+        # 目前生效的設定（棋盤格參數變更時清除）
+        self._checkerboard_config = None
+
         # 外參標定結果
         self._extrinsic_result = None
 
-        # 座標轉換器
+        # 座標轉換器與建立它時的參數簽章 (K, D, rvec, tvec)
         self._transformer = None
+        self._transformer_sig = None
 
-        # 點位數據 [id, image_x, image_y, world_x, world_y]
-        self._point_data: list = []
+        # 座標轉換輸入緩衝區（建立轉換器時配置，轉換時原地填值）
+        self._pixel_buf = None
+        self._world_buf = None
 
-        # 生成的世界座標
-        self._generated_world_coords: list = []
+        # 點位數據 ndarray (N, 5)：[id, image_x, image_y, world_x, world_y]
+        # 逐筆新增時寫入預留容量的緩衝區，_point_data 為其前 N 列的視圖
+        import numpy as np
+        self._point_data = np.empty((0, 5), dtype=np.float64)
+        self._point_buf: Optional[np.ndarray] = None
 
         # WebCAM 標記點 [{name, pixel_x, pixel_y, world_x, world_y}, ...]
         self._marked_points: list = []
 
+        # 延遲建構的頁籤 {頁籤容器: (容器佈局, 建構函式)}，第一次切換到該頁籤時才建立內容
+        self._lazy_tab_builders: dict = {}
+        self._transform_tab_built = False
+
+        # 頁籤建構期間就可能被信號或縮放事件存取的元件，建立前為 None
+        self.image_scene = None
+        self.ext_webcam_points_table = None
+        self.ext_use_points_radio = None
+        # 外參標記點表格隱藏期間的變更只標記待更新，顯示時再一次同步
+        self._ext_points_dirty = False
+        self.algo_desc_label = None
+
         # 設置 UI
         self._setup_ui()
         self._setup_menu()
@@ -580,6 +934,10 @@ class MainWindow(QMainWindow):
         self.square_size_spin.setToolTip("棋盤格每個方格的實際邊長（公分）")
         cb_layout.addRow("方格邊長：", self.square_size_spin)
 
+        # 參數變更時才重建設定，熱路徑直接讀取快取的設定物件
+        for spin in (self.cols_spin, self.rows_spin, self.square_size_spin):
+            spin.valueChanged.connect(self._on_checkerboard_changed)
+
         layout.addWidget(cb_group)
 
         # ===== 圖像列表 =====
@@ -639,6 +997,7 @@ class MainWindow(QMainWindow):
 
         # ===== 進度條 =====
         self.progress_bar = QProgressBar()
+        self.theme_manager.apply_local_style(self.progress_bar, "QProgressBar")
         self.progress_bar.setVisible(False)
         self.progress_bar.setTextVisible(False)
         layout.addWidget(self.progress_bar)
@@ -660,18 +1019,36 @@ class MainWindow(QMainWindow):
         self.tab_widget.addTab(self._create_intrinsic_tab(), "內參標定")
         self.tab_widget.addTab(self._create_points_tab(), "點位數據")
         self.tab_widget.addTab(self._create_extrinsic_tab(), "外參計算")
-        self.tab_widget.addTab(self._create_transform_tab(), "座標轉換")
+        # 座標轉換頁籤需要外參後才能使用，且不被其他頁籤引用，延遲到第一次開啟才建立
+        self.tab_widget.addTab(self._create_lazy_tab(self._create_transform_tab), "座標轉換")
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
 
         layout.addWidget(self.tab_widget)
         return panel
 
+    def _create_lazy_tab(self, builder) -> QWidget:
+        """建立延遲建構的頁籤容器"""
+        page = QWidget()
+        page_layout = QVBoxLayout(page)
+        page_layout.setContentsMargins(0, 0, 0, 0)
+        self._lazy_tab_builders[page] = (page_layout, builder)
+        return page
+
+    @Slot(int)
+    def _on_tab_changed(self, index: int):
+        """切換頁籤時建立尚未建構的頁籤內容"""
+        page = self.tab_widget.widget(index)
+        pending = self._lazy_tab_builders.pop(page, None)
+        if pending is not None:
+            page_layout, builder = pending
+            page_layout.addWidget(builder())
+
     def _create_webcam_tab(self) -> QWidget:
         """建立 WebCAM 頁籤"""
         from PySide6.QtWidgets import (
             QGroupBox, QPushButton, QComboBox, QFormLayout, QTableWidget,
-            QTableWidgetItem, QHeaderView,
+            QHeaderView,
         )
-        from PySide6.QtCore import QTimer
 
         container = QWidget()
         main_layout = QVBoxLayout(container)
@@ -924,23 +1301,32 @@ class MainWindow(QMainWindow):
 
     def _on_viewer_mouse_moved(self, img_x: float, img_y: float):
         """滑鼠在圖像上移動"""
-        self.webcam_coord_label.setText(f"({img_x:.1f}, {img_y:.1f})")
+        self._coord_text = f"({img_x:.1f}, {img_y:.1f})"
+        if not self._coord_timer.isActive():
+            self._coord_timer.start()
+
+    def _flush_coord_label(self):
+        """將暫存的游標座標寫入標籤"""
+        self.webcam_coord_label.setText(self._coord_text)
 
     def _on_viewer_mouse_left(self):
         """滑鼠離開圖像"""
+        self._coord_timer.stop()
+        self._coord_text = ""
         self.webcam_coord_label.setText("")
 
     def eventFilter(self, obj, event):
-        """事件過濾器 - 處理表格鍵盤事件"""
-        from PySide6.QtCore import QEvent
-        from PySide6.QtGui import QKeyEvent
-
+        """事件過濾器 - 處理表格鍵盤事件與外參表格顯示"""
         if obj == self.marked_points_table and event.type() == QEvent.KeyPress:
             key = event.key()
             # Delete 或 Backspace 刪除選中點
             if key in (Qt.Key_Delete, Qt.Key_Backspace):
                 self._delete_selected_point()
                 return True
+        elif (obj is self.ext_webcam_points_table and event.type() == QEvent.Show
+              and self._ext_points_dirty):
+            # 切換到外參頁籤時補上隱藏期間累積的標記點變更
+            self._update_extrinsic_points_table()
 
         return super().eventFilter(obj, event)
 
@@ -1002,27 +1388,20 @@ class MainWindow(QMainWindow):
 
     def _update_marked_points_table(self, select_last: bool = False):
         """更新標記點表格"""
-        from PySide6.QtWidgets import QTableWidgetItem
         from PySide6.QtCore import QTimer
 
         # 暫時阻止信號避免觸發不必要的事件
         self.marked_points_table.blockSignals(True)
 
-        self.marked_points_table.setRowCount(len(self._marked_points))
+        table = self.marked_points_table
+        table.setRowCount(len(self._marked_points))
         for i, point in enumerate(self._marked_points):
             # 名稱欄位（可編輯）
-            name_item = QTableWidgetItem(point['name'])
-            self.marked_points_table.setItem(i, 0, name_item)
-
-            # X 座標（唯讀）
-            x_item = QTableWidgetItem(f"{point['pixel_x']:.1f}")
-            x_item.setFlags(x_item.flags() & ~Qt.ItemIsEditable)
-            self.marked_points_table.setItem(i, 1, x_item)
+            self._set_table_text(table, i, 0, point['name'])
 
-            # Y 座標（唯讀）
-            y_item = QTableWidgetItem(f"{point['pixel_y']:.1f}")
-            y_item.setFlags(y_item.flags() & ~Qt.ItemIsEditable)
-            self.marked_points_table.setItem(i, 2, y_item)
+            # X、Y 座標（唯讀）
+            self._set_table_text(table, i, 1, f"{point['pixel_x']:.1f}", editable=False)
+            self._set_table_text(table, i, 2, f"{point['pixel_y']:.1f}", editable=False)
 
         self.marked_points_table.blockSignals(False)
 
@@ -1032,6 +1411,24 @@ class MainWindow(QMainWindow):
             # 使用 QTimer.singleShot 確保在事件循環中執行
             QTimer.singleShot(0, lambda: self._select_table_row(last_row))
 
+    @staticmethod
+    def _set_table_text(table, row: int, column: int, text: str, editable: bool = True):
+        """更新表格儲存格文字
+
+        已存在的儲存格直接沿用並只在文字改變時 setText，只有新增的列
+        才建立 QTableWidgetItem，避免每次刷新都重建整張表格的項目。
+        """
+        from PySide6.QtWidgets import QTableWidgetItem
+
+        item = table.item(row, column)
+        if item is None:
+            item = QTableWidgetItem(text)
+            if not editable:
+                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
+            table.setItem(row, column, item)
+        elif item.text() != text:
+            item.setText(text)
+
     def _select_table_row(self, row: int):
         """選中表格中指定的行"""
         if row < self.marked_points_table.rowCount():
@@ -1166,7 +1563,9 @@ class MainWindow(QMainWindow):
         """
         from PySide6.QtGui import QPixmap
 
-        if self._is_paused:
+        # 暫停中，或 WebCAM 頁籤不在前景時不必轉換與縮放；
+        # 切回頁籤後下一幀就會更新畫面
+        if self._is_paused or not self.image_viewer.isVisible():
             return
 
         # 將預覽圖縮放至填滿顯示區域
@@ -1267,13 +1666,12 @@ class MainWindow(QMainWindow):
     def _save_captured_photo(self):
         """儲存拍攝的照片"""
         import cv2
-        from datetime import datetime
 
         if self._captured_frame is None:
             return
 
         # 預設檔名
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         default_name = f"capture_{timestamp}.jpg"
 
         file_path, _ = QFileDialog.getSaveFileName(
@@ -1312,43 +1710,35 @@ class MainWindow(QMainWindow):
 
     def _update_extrinsic_points_table(self):
         """將 WebCAM 標記點同步到外參計算表格"""
-        from PySide6.QtWidgets import QTableWidgetItem
-
         # 如果表格尚未創建，跳過
-        if not hasattr(self, 'ext_webcam_points_table'):
+        if self.ext_webcam_points_table is None:
+            return
+
+        # 在 WebCAM 頁籤連續標記、拖曳、改名時外參表格並不可見，
+        # 只記下待更新，切換過去時（Show 事件）再同步一次
+        if not self.ext_webcam_points_table.isVisible():
+            self._ext_points_dirty = True
             return
+        self._ext_points_dirty = False
 
         # 暫時斷開信號以避免遞迴
         self.ext_webcam_points_table.blockSignals(True)
 
         # 更新表格
-        self.ext_webcam_points_table.setRowCount(len(self._marked_points))
+        table = self.ext_webcam_points_table
+        table.setRowCount(len(self._marked_points))
 
         for i, point in enumerate(self._marked_points):
-            # 名稱欄位（唯讀）
-            name_item = QTableWidgetItem(point['name'])
-            name_item.setFlags(name_item.flags() & ~Qt.ItemIsEditable)
-            self.ext_webcam_points_table.setItem(i, 0, name_item)
-
-            # 像素 X（唯讀）
-            px_item = QTableWidgetItem(f"{point['pixel_x']:.1f}")
-            px_item.setFlags(px_item.flags() & ~Qt.ItemIsEditable)
-            self.ext_webcam_points_table.setItem(i, 1, px_item)
-
-            # 像素 Y（唯讀）
-            py_item = QTableWidgetItem(f"{point['pixel_y']:.1f}")
-            py_item.setFlags(py_item.flags() & ~Qt.ItemIsEditable)
-            self.ext_webcam_points_table.setItem(i, 2, py_item)
-
-            # 世界 X（可編輯）
-            wx_val = "" if point['world_x'] is None else f"{point['world_x']:.2f}"
-            wx_item = QTableWidgetItem(wx_val)
-            self.ext_webcam_points_table.setItem(i, 3, wx_item)
+            # 名稱、像素 X、像素 Y（唯讀）
+            self._set_table_text(table, i, 0, point['name'], editable=False)
+            self._set_table_text(table, i, 1, f"{point['pixel_x']:.1f}", editable=False)
+            self._set_table_text(table, i, 2, f"{point['pixel_y']:.1f}", editable=False)
 
-            # 世界 Y（可編輯）
+            # 世界 X、Y（可編輯）
+            wx_val = "" if point['world_x'] is None else f"{point['world_x']:.2f}"
             wy_val = "" if point['world_y'] is None else f"{point['world_y']:.2f}"
-            wy_item = QTableWidgetItem(wy_val)
-            self.ext_webcam_points_table.setItem(i, 4, wy_item)
+            self._set_table_text(table, i, 3, wx_val)
+            self._set_table_text(table, i, 4, wy_val)
 
         # 恢復信號
         self.ext_webcam_points_table.blockSignals(False)
@@ -1396,7 +1786,7 @@ class MainWindow(QMainWindow):
 
     def _check_extrinsic_ready(self):
         """檢查外參計算是否滿足條件，更新按鈕和狀態"""
-        if not hasattr(self, 'ext_webcam_points_table'):
+        if self.ext_webcam_points_table is None:
             return
 
         # 計算有完整世界座標的點數
@@ -1407,44 +1797,46 @@ class MainWindow(QMainWindow):
 
         # 獲取當前算法的最低點數要求
         algo = self.ext_algo_combo.currentData()
-        if algo == "SOLVEPNP_P3P":
-            min_points = 3
-            algo_name = "P3P"
-        elif algo == "SOLVEPNP_AP3P":
-            min_points = 3
-            algo_name = "AP3P"
-        else:
-            min_points = 4
-            algo_name = "PnP"
+        min_points, algo_name = _PNP_MIN_POINTS.get(algo, _PNP_DEFAULT_MIN_POINTS)
 
         # 更新狀態標籤
         total_points = len(self._marked_points)
         if total_points == 0:
-            self.ext_webcam_points_status.setText("尚無標記點（請在 WebCAM 頁籤拍照並標記）")
-            self.ext_webcam_points_status.setStyleSheet("color: #ea4335;")
+            status = "尚無標記點（請在 WebCAM 頁籤拍照並標記）"
+            style = _STATUS_ERROR_STYLE
         elif valid_points < min_points:
-            self.ext_webcam_points_status.setText(
-                f"已標記 {total_points} 點，有效 {valid_points} 點（{algo_name} 需要 ≥{min_points} 點）"
-            )
-            self.ext_webcam_points_status.setStyleSheet("color: #ea4335;")
+            status = f"已標記 {total_points} 點，有效 {valid_points} 點（{algo_name} 需要 ≥{min_points} 點）"
+            style = _STATUS_ERROR_STYLE
         else:
-            self.ext_webcam_points_status.setText(
-                f"已標記 {total_points} 點，有效 {valid_points} 點 ✓"
-            )
-            self.ext_webcam_points_status.setStyleSheet("color: #34a853;")
+            status = f"已標記 {total_points} 點，有效 {valid_points} 點 ✓"
+            style = _STATUS_OK_STYLE
+        self.ext_webcam_points_status.setText(status)
+        # 每次標記/編輯點位都會呼叫此處；樣式表只在狀態切換時重設，
+        # 避免每次都重新解析樣式並重新 polish 標籤
+        if self.ext_webcam_points_status.styleSheet() != style:
+            self.ext_webcam_points_status.setStyleSheet(style)
 
         # 更新計算按鈕狀態（需要內參和足夠的點）
         has_intrinsic = self._result is not None and self._result.intrinsic is not None
-        can_calculate = has_intrinsic and valid_points >= min_points
+        # 與 _on_calibrate_extrinsic 一致：WebCAM 標記點或點位數據頁籤任一足夠即可
+        can_calculate = has_intrinsic and (
+            valid_points >= min_points or len(self._point_data) >= min_points
+        )
 
-        # 如果選擇使用 WebCAM 點位，則用這個條件
-        if hasattr(self, 'ext_use_points_radio') and self.ext_use_points_radio.isChecked():
+        # 點位數據模式
+        if self.ext_use_points_radio is not None and self.ext_use_points_radio.isChecked():
             self.ext_calibrate_btn.setEnabled(can_calculate)
+        elif self.ext_use_corners_radio.isChecked():
+            # 圖像角點模式：需要內參與已選擇的圖像，背景偵測角點期間保持禁用
+            self.ext_calibrate_btn.setEnabled(
+                has_intrinsic
+                and self.ext_image_combo.currentData() is not None
+                and self._ext_corner_worker is None
+            )
 
     def _create_intrinsic_tab(self) -> QWidget:
         """建立內參標定頁籤"""
-        from PySide6.QtWidgets import QTextEdit, QGraphicsView, QGraphicsScene, QGraphicsPixmapItem
-        from PySide6.QtGui import QPixmap
+        from PySide6.QtWidgets import QTextEdit, QGraphicsView, QGraphicsScene
 
         widget = QWidget()
         layout = QVBoxLayout(widget)
@@ -1468,13 +1860,7 @@ class MainWindow(QMainWindow):
         self.image_scene = QGraphicsScene()
         self.image_view = QGraphicsView(self.image_scene)
         self.image_view.setMinimumHeight(200)
-        self.image_view.setStyleSheet("""
-            QGraphicsView {
-                border: 1px solid #dadce0;
-                border-radius: 8px;
-                background-color: #f8f9fa;
-            }
-        """)
+        self.theme_manager.apply_local_style(self.image_view, "QGraphicsView")
         from PySide6.QtGui import QPainter
         self.image_view.setRenderHints(
             QPainter.RenderHint.Antialiasing |
@@ -1502,6 +1888,7 @@ class MainWindow(QMainWindow):
 
         self.intrinsic_view = QTextEdit()
         self.intrinsic_view.setReadOnly(True)
+        self.theme_manager.apply_local_style(self.intrinsic_view, "QTextEdit")
         self.intrinsic_view.setPlaceholderText(
             "請依照以下步驟進行相機標定：\n\n"
             "① 設定棋盤格參數（行數、列數、方格邊長）\n"
@@ -1523,8 +1910,8 @@ class MainWindow(QMainWindow):
     def _create_points_tab(self) -> QWidget:
         """建立點位數據管理頁籤"""
         from PySide6.QtWidgets import (
-            QTextEdit, QGroupBox, QPushButton,
-            QFormLayout, QTableWidget, QTableWidgetItem, QHeaderView,
+            QGroupBox, QPushButton,
+            QFormLayout, QTableView, QHeaderView,
             QDoubleSpinBox, QSpinBox, QScrollArea,
         )
 
@@ -1629,10 +2016,10 @@ class MainWindow(QMainWindow):
         list_layout = QVBoxLayout(list_group)
         list_layout.setContentsMargins(12, 20, 12, 12)
 
-        # 表格
-        self.points_table = QTableWidget()
-        self.points_table.setColumnCount(5)
-        self.points_table.setHorizontalHeaderLabels(["ID", "像素X", "像素Y", "世界X", "世界Y"])
+        # 表格（模型/視圖：只繪製可見的列）
+        self.points_model = PointTableModel(self)
+        self.points_table = QTableView()
+        self.points_table.setModel(self.points_model)
         self.points_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.points_table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.points_table.setMinimumHeight(150)
@@ -1747,7 +2134,7 @@ class MainWindow(QMainWindow):
         webcam_points_layout.addWidget(webcam_points_desc)
 
         # 標記點表格
-        from PySide6.QtWidgets import QTableWidget, QTableWidgetItem, QHeaderView
+        from PySide6.QtWidgets import QTableWidget, QHeaderView
         self.ext_webcam_points_table = QTableWidget()
         self.ext_webcam_points_table.setColumnCount(5)
         self.ext_webcam_points_table.setHorizontalHeaderLabels([
@@ -1757,12 +2144,13 @@ class MainWindow(QMainWindow):
         self.ext_webcam_points_table.setMinimumHeight(120)
         self.ext_webcam_points_table.setMaximumHeight(200)
         self.ext_webcam_points_table.cellChanged.connect(self._on_ext_world_coord_changed)
+        self.ext_webcam_points_table.installEventFilter(self)
         webcam_points_layout.addWidget(self.ext_webcam_points_table)
 
         # 點位狀態
         self.ext_webcam_points_status = QLabel("尚無標記點（請在 WebCAM 頁籤拍照並標記）")
         self.ext_webcam_points_status.setProperty("subheading", True)
-        self.ext_webcam_points_status.setStyleSheet("color: #ea4335;")
+        self.ext_webcam_points_status.setStyleSheet(_STATUS_ERROR_STYLE)
         webcam_points_layout.addWidget(self.ext_webcam_points_status)
 
         layout.addWidget(webcam_points_group)
@@ -1808,12 +2196,8 @@ class MainWindow(QMainWindow):
 
         algo_select_layout = QFormLayout()
         self.ext_algo_combo = QComboBox()
-        self.ext_algo_combo.addItem("PnP 迭代法 (≥4點, 推薦)", "SOLVEPNP_ITERATIVE")
-        self.ext_algo_combo.addItem("EPnP 算法 (≥4點, 高效)", "SOLVEPNP_EPNP")
-        self.ext_algo_combo.addItem("P3P 算法 (=3點)", "SOLVEPNP_P3P")
-        self.ext_algo_combo.addItem("AP3P 算法 (≥3點)", "SOLVEPNP_AP3P")
-        self.ext_algo_combo.addItem("IPPE 算法 (≥4點, 平面)", "SOLVEPNP_IPPE")
-        self.ext_algo_combo.addItem("IPPE_SQUARE (≥4點, 正方形)", "SOLVEPNP_IPPE_SQUARE")
+        for label, algo in _PNP_ALGORITHMS:
+            self.ext_algo_combo.addItem(label, algo)
         self.ext_algo_combo.currentIndexChanged.connect(self._on_algo_changed)
         algo_select_layout.addRow("PnP 算法：", self.ext_algo_combo)
         algo_layout.addLayout(algo_select_layout)
@@ -1836,6 +2220,10 @@ class MainWindow(QMainWindow):
         self.ext_calibrate_btn.clicked.connect(self._on_calibrate_extrinsic)
         btn_layout.addWidget(self.ext_calibrate_btn)
 
+        # 切換計算方式時依新模式的條件更新計算按鈕
+        self.ext_use_points_radio.toggled.connect(self._check_extrinsic_ready)
+        self.ext_use_corners_radio.toggled.connect(self._check_extrinsic_ready)
+
         self.ext_export_btn = QPushButton("匯出外參")
         self.ext_export_btn.clicked.connect(self._on_export_extrinsic)
         self.ext_export_btn.setEnabled(False)
@@ -1850,6 +2238,7 @@ class MainWindow(QMainWindow):
 
         self.extrinsic_view = QTextEdit()
         self.extrinsic_view.setReadOnly(True)
+        self.theme_manager.apply_local_style(self.extrinsic_view, "QTextEdit")
         self.extrinsic_view.setPlaceholderText(
             "外參標定流程：\n\n"
             "方式一（推薦）：使用點位數據\n"
@@ -1875,8 +2264,8 @@ class MainWindow(QMainWindow):
     def _create_transform_tab(self) -> QWidget:
         """建立座標轉換頁籤"""
         from PySide6.QtWidgets import (
-            QTextEdit, QGroupBox, QDoubleSpinBox, QPushButton,
-            QFormLayout, QGridLayout, QScrollArea,
+            QGroupBox, QDoubleSpinBox, QPushButton,
+            QFormLayout, QScrollArea,
         )
 
         # 外層容器
@@ -1998,6 +2387,11 @@ class MainWindow(QMainWindow):
         scroll.setWidget(widget)
         container_layout.addWidget(scroll)
 
+        # 頁籤建立前已完成外參時，直接啟用轉換功能
+        self._transform_tab_built = True
+        if self._transformer is not None:
+            self._enable_transform_buttons()
+
         return container
 
     def _setup_menu(self):
@@ -2144,41 +2538,90 @@ class MainWindow(QMainWindow):
 
     def _display_image(self, image_path: str):
         """顯示圖像（含角點標記）"""
-        from PySide6.QtGui import QPixmap, QImage
+        from PySide6.QtGui import QPixmap, QImage, QImageReader
         import cv2
         import numpy as np
 
-        try:
-            # 讀取圖像（支援中文路徑）
-            with open(image_path, 'rb') as f:
-                data = np.frombuffer(f.read(), dtype=np.uint8)
-            img = cv2.imdecode(data, cv2.IMREAD_COLOR)
+        corners = self._corner_cache.get(image_path)
+        pattern_size = self._get_checkerboard_config().pattern_size
+        # 偵測失敗時快取存的也是 None，需另外比對「是否已偵測」（資訊標籤依此顯示）
+        detected = image_path in self._corner_cache
+        state = self._preview_state
+        if (state is not None and state[0] == image_path
+                and state[1] is corners and state[2] == pattern_size
+                and state[3] == detected):
+            return
 
-            if img is None:
-                self.image_info_label.setText("無法載入圖像")
-                return
+        try:
+            if self._preview_base is not None and self._preview_base[0] == image_path:
+                _, base, scale, (w, h) = self._preview_base
+            else:
+                # 預覽一律縮放至檢視器內顯示，超出螢幕解析度的像素看不到；
+                # 先由檔頭取得原始尺寸，以 IMREAD_REDUCED_* 在解碼時直接縮小
+                # （JPEG 於 DCT 域縮放），再縮至螢幕大小後繪製角點與轉換色彩
+                screen = self.image_view.screen()
+                max_size = screen.availableGeometry().size() * screen.devicePixelRatio()
+                max_w, max_h = max_size.width(), max_size.height()
+
+                header_size = QImageReader(image_path).size()
+                decode_flag = cv2.IMREAD_COLOR
+                if header_size.isValid():
+                    for factor, flag in (
+                        (8, cv2.IMREAD_REDUCED_COLOR_8),
+                        (4, cv2.IMREAD_REDUCED_COLOR_4),
+                        (2, cv2.IMREAD_REDUCED_COLOR_2),
+                    ):
+                        if (header_size.width() // factor >= max_w
+                                or header_size.height() // factor >= max_h):
+                            decode_flag = flag
+                            break
+
+                # 讀取圖像（支援中文路徑）
+                with open(image_path, 'rb') as f:
+                    data = np.frombuffer(f.read(), dtype=np.uint8)
+                base = cv2.imdecode(data, decode_flag)
+
+                if base is None:
+                    self.image_info_label.setText("無法載入圖像")
+                    return
 
-            # 如果有角點資料，繪製角點
-            if image_path in self._corner_cache:
-                corners = self._corner_cache[image_path]
-                if corners is not None:
-                    cv2.drawChessboardCorners(
-                        img,
-                        (self.cols_spin.value(), self.rows_spin.value()),
-                        corners,
-                        True
-                    )
+                if header_size.isValid():
+                    w, h = header_size.width(), header_size.height()
+                    # 解碼時會套用 EXIF 旋轉，寬高可能與檔頭對調
+                    if (w > h) != (base.shape[1] > base.shape[0]):
+                        w, h = h, w
+                else:
+                    h, w = base.shape[:2]
+                scale = min(1.0, max_w / w, max_h / h)
+                target = (max(1, round(w * scale)), max(1, round(h * scale)))
+                if (base.shape[1], base.shape[0]) != target:
+                    base = cv2.resize(base, target, interpolation=cv2.INTER_AREA)
+                self._preview_base = (image_path, base, scale, (w, h))
+
+            # 如果有角點資料，在副本上繪製角點，保留未標記的底圖
+            if corners is not None:
+                img = base.copy()
+                cv2.drawChessboardCorners(
+                    img,
+                    pattern_size,
+                    corners * scale if scale < 1.0 else corners,
+                    True
+                )
+            else:
+                img = base
 
             # 轉換為 QPixmap
             img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-            h, w, ch = img_rgb.shape
-            bytes_per_line = ch * w
-            q_img = QImage(img_rgb.data, w, h, bytes_per_line, QImage.Format_RGB888)
+            disp_h, disp_w, ch = img_rgb.shape
+            bytes_per_line = ch * disp_w
+            q_img = QImage(img_rgb.data, disp_w, disp_h, bytes_per_line, QImage.Format_RGB888)
             pixmap = QPixmap.fromImage(q_img)
 
-            # 顯示在場景中
-            self.image_scene.clear()
-            self.image_pixmap_item = self.image_scene.addPixmap(pixmap)
+            # 顯示在場景中（沿用既有的圖元，只替換圖像）
+            if self.image_pixmap_item is None:
+                self.image_pixmap_item = self.image_scene.addPixmap(pixmap)
+            else:
+                self.image_pixmap_item.setPixmap(pixmap)
             self.image_scene.setSceneRect(pixmap.rect().toRectF())
 
             # 自適應縮放
@@ -2189,17 +2632,43 @@ class MainWindow(QMainWindow):
 
             # 更新資訊標籤
             filename = Path(image_path).name
-            corner_status = "（已偵測角點）" if image_path in self._corner_cache else ""
+            corner_status = "（已偵測角點）" if detected else ""
             self.image_info_label.setText(f"{filename} - {w}×{h} {corner_status}")
+            self._preview_state = (image_path, corners, pattern_size, detected)
 
         except Exception as e:
             self.image_info_label.setText(f"載入失敗：{e}")
             logger.error(f"載入圖像失敗：{e}")
 
+    def _on_checkerboard_changed(self):
+        """棋盤格參數變更，使目前設定失效"""
+        self._checkerboard_config = None
+
+    def _get_checkerboard_config(self):
+        """取得目前棋盤格設定（相同參數重複使用同一個物件）"""
+        if self._checkerboard_config is not None:
+            return self._checkerboard_config
+
+        from vision_calib.core.types import CheckerboardConfig
+
+        key = (
+            self.rows_spin.value(),
+            self.cols_spin.value(),
+            self.square_size_spin.value() * 10,  # cm → mm
+        )
+        config = self._checkerboard_configs.get(key)
+        if config is None:
+            config = CheckerboardConfig(rows=key[0], cols=key[1], square_size_mm=key[2])
+            self._checkerboard_configs[key] = config
+        self._checkerboard_config = config
+        return config
+
     def _clear_image_preview(self):
         """清除圖像預覽"""
         self.image_scene.clear()
         self.image_pixmap_item = None
+        self._preview_base = None
+        self._preview_state = None
         self.image_info_label.setText("點擊左側列表中的圖像進行預覽")
 
     @Slot()
@@ -2209,14 +2678,9 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "提示", "請先載入圖像")
             return
 
-        from vision_calib.core.types import CheckerboardConfig
         from vision_calib.utils.worker import CornerDetectionWorker
 
-        config = CheckerboardConfig(
-            rows=self.rows_spin.value(),
-            cols=self.cols_spin.value(),
-            square_size_mm=self.square_size_spin.value() * 10,  # cm → mm
-        )
+        config = self._get_checkerboard_config()
 
         # 取得圖像路徑
         paths = []
@@ -2235,22 +2699,28 @@ class MainWindow(QMainWindow):
         # 建立並啟動工作執行緒
         self._corner_worker = CornerDetectionWorker(paths, config, self)
         self._corner_worker.progress.connect(self._on_corner_progress)
-        self._corner_worker.single_result.connect(self._on_corner_single_result)
+        self._corner_worker.batch_result.connect(self._on_corner_batch_result)
         self._corner_worker.finished.connect(self._on_corner_finished)
         self._corner_worker.error.connect(self._on_corner_error)
         self._corner_worker.start()
 
-    @Slot(int, int, str)
-    def _on_corner_progress(self, current: int, total: int, message: str):
+    @Slot(int, int)
+    def _on_corner_progress(self, current: int, total: int):
         """角點偵測進度更新"""
         self.progress_bar.setValue(current)
-        self.statusbar.showMessage(message)
-
-    @Slot(object)
-    def _on_corner_single_result(self, result):
-        """單張圖像角點偵測結果"""
-        item = self.image_list.item(result.index)
-        if item:
+        self.statusbar.showMessage(f"正在偵測 ({current}/{total})...")
+
+    @Slot(list)
+    def _on_corner_batch_result(self, results):
+        """一批圖像的角點偵測結果"""
+        current_item = self.image_list.currentItem()
+        current_path = current_item.data(Qt.UserRole) if current_item else None
+        refresh_current = False
+
+        for result in results:
+            item = self.image_list.item(result.index)
+            if not item:
+                continue
             filename = Path(result.image_path).name
             if result.success:
                 item.setText(f"✓ {filename}")
@@ -2260,10 +2730,12 @@ class MainWindow(QMainWindow):
                 item.setText(f"✗ {filename}")
                 self._corner_cache[result.image_path] = None
 
-            # 如果當前選中的是這張圖，更新預覽
-            current_item = self.image_list.currentItem()
-            if current_item and current_item.data(Qt.UserRole) == result.image_path:
-                self._display_image(result.image_path)
+            if result.image_path == current_path:
+                refresh_current = True
+
+        # 如果當前選中的圖在這批中，更新預覽
+        if refresh_current:
+            self._display_image(current_path)
 
     @Slot(int, int)
     def _on_corner_finished(self, success_count: int, total_count: int):
@@ -2293,15 +2765,10 @@ class MainWindow(QMainWindow):
             return
 
         from vision_calib.core.intrinsic import IntrinsicCalibrationConfig
-        from vision_calib.core.types import CheckerboardConfig
         from vision_calib.utils.worker import CalibrationWorker
 
         config = IntrinsicCalibrationConfig(
-            checkerboard=CheckerboardConfig(
-                rows=self.rows_spin.value(),
-                cols=self.cols_spin.value(),
-                square_size_mm=self.square_size_spin.value() * 10,  # cm → mm
-            )
+            checkerboard=self._get_checkerboard_config()
         )
 
         # 取得圖像路徑
@@ -2467,11 +2934,8 @@ class MainWindow(QMainWindow):
                 # 更新外參頁面狀態提示
                 self.ext_image_combo.clear()
                 self.ext_image_combo.addItem("-- 請新增圖像並偵測角點 --")
-                # 如果已有點位數據，保持按鈕啟用；否則禁用
-                if len(self._point_data) >= 3:
-                    self.ext_calibrate_btn.setEnabled(True)
-                else:
-                    self.ext_calibrate_btn.setEnabled(False)
+                # 依目前的計算方式與點位更新計算按鈕
+                self._check_extrinsic_ready()
 
                 # 顯示提示訊息
                 QMessageBox.information(
@@ -2508,8 +2972,12 @@ class MainWindow(QMainWindow):
     def resizeEvent(self, event):
         """視窗縮放時調整圖像顯示"""
         super().resizeEvent(event)
-        # 重新調整圖像檢視器的縮放
-        if hasattr(self, 'image_scene') and self.image_scene.items():
+        # 重新調整圖像檢視器的縮放（排程合併連續的縮放事件）
+        self._fit_timer.start()
+
+    def _fit_image_view(self):
+        """將預覽圖像適配檢視器大小"""
+        if self.image_scene is not None and self.image_scene.items():
             self.image_view.fitInView(
                 self.image_scene.sceneRect(),
                 Qt.KeepAspectRatio
@@ -2517,51 +2985,112 @@ class MainWindow(QMainWindow):
 
     def _update_extrinsic_image_combo(self):
         """更新外參標定的圖像選擇下拉選單"""
-        self.ext_image_combo.clear()
-
         # 列出所有已載入的圖像（優先顯示已偵測角點的）
         all_images = []
         for i in range(self.image_list.count()):
             item = self.image_list.item(i)
             image_path = item.data(Qt.UserRole)
-            has_corners = image_path in self._corner_cache and self._corner_cache[image_path] is not None
+            has_corners = self._corner_cache.get(image_path) is not None
             all_images.append((Path(image_path).name, image_path, has_corners))
 
         if not all_images:
+            self.ext_image_combo.clear()
             self.ext_image_combo.addItem("-- 請先新增圖像 --")
-            self.ext_calibrate_btn.setEnabled(False)
+            self._check_extrinsic_ready()
             return
 
         # 先加已偵測角點的，再加未偵測的
-        for name, path, has_corners in all_images:
-            if has_corners:
-                self.ext_image_combo.addItem(f"✓ {name}", path)
-            else:
-                self.ext_image_combo.addItem(f"○ {name} (需偵測)", path)
+        entries = [
+            (f"✓ {name}" if has_corners else f"○ {name} (需偵測)", path)
+            for name, path, has_corners in all_images
+        ]
+
+        # 圖像清單未變時（例如角點偵測或標定完成後）沿用現有項目，
+        # 只更新狀態文字，並保留使用者目前的選擇
+        combo = self.ext_image_combo
+        if combo.count() == len(entries) and all(
+            combo.itemData(i) == path for i, (_, path) in enumerate(entries)
+        ):
+            for i, (text, _) in enumerate(entries):
+                if combo.itemText(i) != text:
+                    combo.setItemText(i, text)
+        else:
+            combo.clear()
+            for text, path in entries:
+                combo.addItem(text, path)
 
-        self.ext_calibrate_btn.setEnabled(True)
+        self._check_extrinsic_ready()
 
         detected_count = sum(1 for _, _, has in all_images if has)
         self.statusbar.showMessage(f"共 {len(all_images)} 張圖像，{detected_count} 張已偵測角點")
 
     def _on_algo_changed(self, index: int):
         """當 PnP 算法選擇變更時更新說明"""
-        algo_descriptions = {
-            "SOLVEPNP_ITERATIVE": "迭代法：最通用，適合大多數情況，需≥4個點",
-            "SOLVEPNP_EPNP": "EPnP：高效率算法，點數較多(>10)時推薦，需≥4個點",
-            "SOLVEPNP_P3P": "P3P：只需剛好3個點，可能有多解，適合點數極少的情況",
-            "SOLVEPNP_AP3P": "AP3P：P3P改進版，數值穩定性更好，需≥3個點",
-            "SOLVEPNP_IPPE": "IPPE：專為平面物體設計，適合棋盤格等平面標定，需≥4個點",
-            "SOLVEPNP_IPPE_SQUARE": "IPPE_SQUARE：IPPE改進版，專為正方形標定板優化，需≥4個點",
-        }
         algo_data = self.ext_algo_combo.currentData()
-        desc = algo_descriptions.get(algo_data, "")
-        if hasattr(self, 'algo_desc_label'):
+        desc = _PNP_DESCRIPTIONS.get(algo_data, "")
+        if self.algo_desc_label is not None:
             self.algo_desc_label.setText(desc)
 
         # 更新計算按鈕狀態
         self._check_extrinsic_ready()
 
+    def _start_extrinsic_corner_detection(self, image_path: str, checkerboard):
+        """在背景執行緒偵測外參圖像的角點"""
+        from vision_calib.utils.worker import CornerDetectionWorker
+
+        if self._ext_corner_worker is not None:
+            return
+
+        self.statusbar.showMessage("正在偵測角點...")
+        self.ext_calibrate_btn.setEnabled(False)
+
+        self._ext_corner_worker = CornerDetectionWorker([image_path], checkerboard, self)
+        self._ext_corner_worker.batch_result.connect(self._on_ext_corner_batch_result)
+        self._ext_corner_worker.finished.connect(self._on_ext_corner_finished)
+        self._ext_corner_worker.error.connect(self._on_ext_corner_error)
+        self._ext_corner_worker.start()
+
+    @Slot(list)
+    def _on_ext_corner_batch_result(self, results):
+        """外參圖像的角點偵測結果"""
+        for result in results:
+            if result.success:
+                self._corner_cache[result.image_path] = result.corners
+
+    @Slot(int, int)
+    def _on_ext_corner_finished(self, success_count: int, total_count: int):
+        """外參圖像角點偵測完成，成功時繼續計算外參"""
+        image_path = self._ext_corner_worker.image_paths[0]
+        self._ext_corner_worker = None
+
+        if success_count == 0:
+            self._check_extrinsic_ready()
+            self.statusbar.showMessage("角點偵測失敗")
+            checkerboard = self._get_checkerboard_config()
+            QMessageBox.warning(
+                self,
+                "角點偵測失敗",
+                f"無法偵測到 {checkerboard.cols}×{checkerboard.rows} 棋盤格角點。"
+            )
+            return
+
+        self._update_extrinsic_image_combo()
+        self._check_extrinsic_ready()
+
+        # 偵測期間使用者可能已切換計算方式或圖像，只在仍選擇同一張圖時繼續
+        if (self.ext_use_corners_radio.isChecked()
+                and self.ext_image_combo.currentData() == image_path):
+            self._on_calibrate_extrinsic()
+        else:
+            self.statusbar.showMessage(f"角點偵測完成：{Path(image_path).name}")
+
+    @Slot(str)
+    def _on_ext_corner_error(self, error_msg: str):
+        """外參圖像角點偵測錯誤"""
+        self._ext_corner_worker = None
+        self._check_extrinsic_ready()
+        QMessageBox.critical(self, "錯誤", f"角點偵測失敗：{error_msg}")
+
     @Slot()
     def _on_calibrate_extrinsic(self):
         """執行外參標定"""
@@ -2576,69 +3105,60 @@ class MainWindow(QMainWindow):
 
         import cv2
         import numpy as np
-        from vision_calib.core.types import CameraExtrinsic
-        from vision_calib.core.extrinsic import ExtrinsicCalibrationResult
+        from vision_calib.core.types import CalibrationError
+        from vision_calib.core.extrinsic import ExtrinsicCalibrator
         from vision_calib.core.transform import CoordinateTransformer
 
         # 取得 PnP 算法
         algo_data = self.ext_algo_combo.currentData()
-        algo_flags = {
-            "SOLVEPNP_ITERATIVE": cv2.SOLVEPNP_ITERATIVE,
-            "SOLVEPNP_EPNP": cv2.SOLVEPNP_EPNP,
-            "SOLVEPNP_P3P": cv2.SOLVEPNP_P3P,
-            "SOLVEPNP_AP3P": cv2.SOLVEPNP_AP3P,
-            "SOLVEPNP_IPPE": cv2.SOLVEPNP_IPPE,
-            "SOLVEPNP_IPPE_SQUARE": cv2.SOLVEPNP_IPPE_SQUARE,
-        }
-        pnp_flag = algo_flags.get(algo_data, cv2.SOLVEPNP_ITERATIVE)
+        # combo data 即 cv2 旗標名稱（見 _PNP_ALGORITHMS），不必每次建立對照表
+        pnp_flag = getattr(cv2, algo_data or "", cv2.SOLVEPNP_ITERATIVE)
 
         # 確定最少需要的點數
-        min_points = 3 if algo_data in ("SOLVEPNP_P3P", "SOLVEPNP_AP3P") else 4
+        min_points, _ = _PNP_MIN_POINTS.get(algo_data, _PNP_DEFAULT_MIN_POINTS)
 
         try:
+            # 棋盤格設定只讀取一次，角點偵測與外參計算共用；
+            # solvePnP 與其結果快取都在 ExtrinsicCalibrator 中
+            checkerboard = self._get_checkerboard_config()
+            calibrator = ExtrinsicCalibrator(self._result.intrinsic, checkerboard)
+
             # 根據選擇的方式進行計算
             if self.ext_use_points_radio.isChecked():
                 # 方式一：使用點位數據
                 # 優先使用 WebCAM 標記點（如果有有效的點）
-                valid_webcam_points = [
-                    p for p in self._marked_points
-                    if p['world_x'] is not None and p['world_y'] is not None
-                ]
-
-                if len(valid_webcam_points) >= min_points:
+                # 一次走訪組成 (N, 4) 陣列 [world_x, world_y, pixel_x, pixel_y]，
+                # 未填的世界座標 (None) 轉為 NaN，再以遮罩一次篩出有效點
+                coords = np.array(
+                    [(p['world_x'], p['world_y'], p['pixel_x'], p['pixel_y'])
+                     for p in self._marked_points],
+                    dtype=np.float64
+                ).reshape(-1, 4)
+                coords = coords[~np.isnan(coords[:, :2]).any(axis=1)]
+                num_valid = len(coords)
+
+                if num_valid >= min_points:
                     # 使用 WebCAM 標記點
                     self.statusbar.showMessage("正在使用 WebCAM 標記點計算外參...")
 
-                    object_points = np.array(
-                        [[p['world_x'], p['world_y'], 0.0] for p in valid_webcam_points],
-                        dtype=np.float32
-                    )
-                    image_points = np.array(
-                        [[p['pixel_x'], p['pixel_y']] for p in valid_webcam_points],
-                        dtype=np.float32
-                    )
+                    object_points = np.zeros((num_valid, 3), dtype=np.float32)
+                    object_points[:, :2] = coords[:, :2]
+                    image_points = coords[:, 2:].astype(np.float32)
                     source = "webcam_points"
-                    num_points = len(valid_webcam_points)
                 elif len(self._point_data) >= min_points:
                     # 使用點位數據頁籤的數據
                     self.statusbar.showMessage("正在使用點位數據計算外參...")
 
-                    object_points = np.array(
-                        [[p[3], p[4], 0.0] for p in self._point_data],
-                        dtype=np.float32
-                    )
-                    image_points = np.array(
-                        [[p[1], p[2]] for p in self._point_data],
-                        dtype=np.float32
-                    )
+                    object_points = np.zeros((len(self._point_data), 3), dtype=np.float32)
+                    object_points[:, :2] = self._point_data[:, 3:5]
+                    image_points = self._point_data[:, 1:3].astype(np.float32)
                     source = "point_data"
-                    num_points = len(self._point_data)
                 else:
                     QMessageBox.warning(
                         self,
                         "點位不足",
                         f"選用的算法至少需要 {min_points} 個點位！\n"
-                        f"WebCAM 標記點：{len(valid_webcam_points)} 個有效點\n"
+                        f"WebCAM 標記點：{num_valid} 個有效點\n"
                         f"點位數據頁籤：{len(self._point_data)} 個點\n\n"
                         "請在 WebCAM 頁籤標記點位並填入世界座標，\n"
                         "或前往「點位數據」頁籤添加點位。"
@@ -2646,41 +3166,14 @@ class MainWindow(QMainWindow):
                     return
 
                 # 執行 solvePnP
-                success, rvec, tvec = cv2.solvePnP(
-                    object_points,
-                    image_points,
-                    self._result.intrinsic.camera_matrix,
-                    self._result.intrinsic.distortion_coeffs,
-                    flags=pnp_flag,
-                )
-
-                if not success:
+                try:
+                    self._extrinsic_result = calibrator.calibrate_points(
+                        object_points, image_points, source, pnp_flag
+                    )
+                except CalibrationError:
                     QMessageBox.critical(self, "失敗", "solvePnP 計算失敗！請檢查點位數據。")
                     return
 
-                # 計算重投影誤差
-                projected, _ = cv2.projectPoints(
-                    object_points,
-                    rvec,
-                    tvec,
-                    self._result.intrinsic.camera_matrix,
-                    self._result.intrinsic.distortion_coeffs,
-                )
-                projected = projected.reshape(-1, 2)
-                error = np.sqrt(np.mean(np.sum((image_points - projected) ** 2, axis=1)))
-
-                # 建立結果
-                extrinsic = CameraExtrinsic(
-                    rotation_vector=rvec,
-                    translation_vector=tvec,
-                )
-                self._extrinsic_result = ExtrinsicCalibrationResult(
-                    extrinsic=extrinsic,
-                    reprojection_error=error,
-                    image_path=source,
-                    num_points=num_points,
-                )
-
             else:
                 # 方式二：使用圖像角點
                 image_path = self.ext_image_combo.currentData()
@@ -2695,53 +3188,39 @@ class MainWindow(QMainWindow):
                 # 取得角點
                 corners = self._corner_cache.get(image_path)
                 if corners is None:
-                    # 自動偵測角點
-                    self.statusbar.showMessage("正在偵測角點...")
-                    from vision_calib.core.corner_detector import CornerDetector
-                    from vision_calib.core.types import CheckerboardConfig
-
-                    config = CheckerboardConfig(
-                        rows=self.rows_spin.value(),
-                        cols=self.cols_spin.value(),
-                        square_size_mm=self.square_size_spin.value() * 10,
-                    )
-                    detector = CornerDetector(config)
-                    result = detector.detect(image_path)
-
-                    if not result.success:
-                        QMessageBox.warning(
-                            self,
-                            "角點偵測失敗",
-                            f"無法偵測到 {self.cols_spin.value()}×{self.rows_spin.value()} 棋盤格角點。"
-                        )
-                        return
-
-                    corners = result.corners
-                    self._corner_cache[image_path] = corners
-                    self._update_extrinsic_image_combo()
+                    # 自動偵測角點（背景執行緒），完成後再繼續計算外參
+                    self._start_extrinsic_corner_detection(image_path, checkerboard)
+                    return
 
                 self.statusbar.showMessage("正在使用圖像角點計算外參...")
 
-                from vision_calib.core.extrinsic import ExtrinsicCalibrator
-                from vision_calib.core.types import CheckerboardConfig
-
-                checkerboard = CheckerboardConfig(
-                    rows=self.rows_spin.value(),
-                    cols=self.cols_spin.value(),
-                    square_size_mm=self.square_size_spin.value() * 10,
-                )
+                # 棋盤格 Z=0 平面座標與迭代法，同一張圖與棋盤格設定
+                # 重按「計算外參」時直接取用 ExtrinsicCalibrator 的結果快取
+                try:
+                    self._extrinsic_result = calibrator.calibrate(image_path, corners)
+                except CalibrationError:
+                    QMessageBox.critical(self, "失敗", "solvePnP 計算失敗！請檢查角點數據。")
+                    return
 
-                calibrator = ExtrinsicCalibrator(
-                    intrinsic=self._result.intrinsic,
-                    checkerboard=checkerboard,
+            # 建立座標轉換器（內外參皆未變時沿用現有的轉換器與緩衝區）
+            intrinsic = self._result.intrinsic
+            extrinsic = self._extrinsic_result.extrinsic
+            sig = tuple(
+                np.ascontiguousarray(a).tobytes() for a in (
+                    intrinsic.camera_matrix,
+                    intrinsic.distortion_coeffs,
+                    extrinsic.rotation_vector,
+                    extrinsic.translation_vector,
                 )
-                self._extrinsic_result = calibrator.calibrate(image_path, corners)
-
-            # 建立座標轉換器
-            self._transformer = CoordinateTransformer(
-                intrinsic=self._result.intrinsic,
-                extrinsic=self._extrinsic_result.extrinsic,
             )
+            if self._transformer is None or sig != self._transformer_sig:
+                self._transformer = CoordinateTransformer(
+                    intrinsic=intrinsic,
+                    extrinsic=extrinsic,
+                )
+                self._transformer_sig = sig
+                self._pixel_buf = np.empty(2, dtype=np.float64)
+                self._world_buf = np.empty(3, dtype=np.float64)
 
             # 顯示結果
             self._display_extrinsic_result()
@@ -2773,6 +3252,8 @@ class MainWindow(QMainWindow):
 
     def _enable_transform_buttons(self):
         """啟用座標轉換按鈕"""
+        if not self._transform_tab_built:
+            return
         self.p2w_btn.setEnabled(True)
         self.w2p_btn.setEnabled(True)
         self.transform_status.setText("座標轉換功能已就緒")
@@ -2784,8 +3265,6 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "提示", "請先完成外參標定")
             return
 
-        import numpy as np
-
         try:
             # 取得輸入
             u = self.pixel_u_spin.value()
@@ -2793,7 +3272,9 @@ class MainWindow(QMainWindow):
             z_world = self.world_z_spin.value()
 
             # 轉換
-            pixel = np.array([u, v])
+            pixel = self._pixel_buf
+            pixel[0] = u
+            pixel[1] = v
             world = self._transformer.pixel_to_world(pixel, z_world)
 
             # 顯示結果
@@ -2812,8 +3293,6 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "提示", "請先完成外參標定")
             return
 
-        import numpy as np
-
         try:
             # 取得輸入
             x = self.world_x_spin.value()
@@ -2821,7 +3300,10 @@ class MainWindow(QMainWindow):
             z = self.world_z_input_spin.value()
 
             # 轉換
-            world = np.array([x, y, z])
+            world = self._world_buf
+            world[0] = x
+            world[1] = y
+            world[2] = z
             pixel = self._transformer.world_to_pixel(world)
 
             # 顯示結果
@@ -2844,7 +3326,7 @@ class MainWindow(QMainWindow):
         world_x = self.point_world_x_spin.value()
         world_y = self.point_world_y_spin.value()
 
-        self._point_data.append([point_id, img_x, img_y, world_x, world_y])
+        self._append_points([[point_id, img_x, img_y, world_x, world_y]])
         self._update_points_table()
 
         # 自動遞增 ID
@@ -2854,26 +3336,41 @@ class MainWindow(QMainWindow):
     @Slot()
     def _on_clear_points(self):
         """清除所有點位數據"""
-        if self._point_data:
+        if len(self._point_data):
             reply = QMessageBox.question(
                 self, "確認清除",
                 f"確定要清除所有 {len(self._point_data)} 個點位嗎？",
                 QMessageBox.Yes | QMessageBox.No,
             )
             if reply == QMessageBox.Yes:
-                self._point_data.clear()
+                self._point_data = self._point_data[:0]
                 self._update_points_table()
                 self.statusbar.showMessage("已清除所有點位")
 
+    def _append_points(self, rows):
+        """附加點位列 [id, image_x, image_y, world_x, world_y]
+
+        容量不足時以倍增方式擴充緩衝區，連續新增為攤銷 O(1)，
+        不會每筆都複製整個陣列。
+        """
+        import numpy as np
+
+        rows = np.asarray(rows, dtype=np.float64).reshape(-1, 5)
+        n, k = len(self._point_data), len(rows)
+
+        buf = self._point_buf
+        if buf is None or self._point_data.base is not buf or n + k > len(buf):
+            # 點位數據被整批替換過，或容量不足：重新配置並複製現有點位
+            buf = np.empty((max(2 * (n + k), 16), 5), dtype=np.float64)
+            buf[:n] = self._point_data
+            self._point_buf = buf
+
+        buf[n:n + k] = rows
+        self._point_data = buf[:n + k]
+
     def _update_points_table(self):
         """更新點位數據表格"""
-        from PySide6.QtWidgets import QTableWidgetItem
-
-        self.points_table.setRowCount(len(self._point_data))
-        for i, point in enumerate(self._point_data):
-            for j, val in enumerate(point):
-                item = QTableWidgetItem(f"{val:.2f}" if isinstance(val, float) else str(int(val)))
-                self.points_table.setItem(i, j, item)
+        self.points_model.set_points(self._point_data)
 
         # 更新標題
         self.points_list_group.setTitle(f"當前點位 (共 {len(self._point_data)} 個)")
@@ -2881,9 +3378,8 @@ class MainWindow(QMainWindow):
         # 更新外參頁面狀態
         self.ext_points_status.setText(f"點位數據：{len(self._point_data)} 個點")
 
-        # 如果有足夠點位且有內參數據，啟用計算外參按鈕
-        if len(self._point_data) >= 3 and self._result is not None:
-            self.ext_calibrate_btn.setEnabled(True)
+        # 依點位數量與內參更新計算外參按鈕
+        self._check_extrinsic_ready()
 
     @Slot()
     def _on_import_points_csv(self):
@@ -2896,20 +3392,11 @@ class MainWindow(QMainWindow):
             return
 
         try:
-            import csv
             with open(file_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                count = 0
-                for row in reader:
-                    # 支持多種欄位名稱
-                    point_id = float(row.get('id', row.get('ID', count + 1)))
-                    img_x = float(row.get('image_x', row.get('img_x', row.get('x', 0))))
-                    img_y = float(row.get('image_y', row.get('img_y', row.get('y', 0))))
-                    world_x = float(row.get('world_x', row.get('X', 0)))
-                    world_y = float(row.get('world_y', row.get('Y', 0)))
-                    self._point_data.append([point_id, img_x, img_y, world_x, world_y])
-                    count += 1
+                rows = _parse_point_csv(f.read().splitlines())
+            count = len(rows)
 
+            self._append_points(rows)
             self._update_points_table()
             self.statusbar.showMessage(f"已匯入 {count} 個點位")
             QMessageBox.information(self, "匯入成功", f"已匯入 {count} 個點位")
@@ -2919,24 +3406,34 @@ class MainWindow(QMainWindow):
     @Slot()
     def _on_export_points_csv(self):
         """匯出點位 CSV"""
-        if not self._point_data:
+        if not len(self._point_data):
             QMessageBox.warning(self, "無數據", "目前沒有點位數據可匯出")
             return
 
         file_path, _ = QFileDialog.getSaveFileName(
             self, "匯出點位數據",
-            "point_data.csv", "CSV 檔案 (*.csv);;所有檔案 (*)",
+            "point_data.csv", "CSV 檔案 (*.csv);;NPY 檔案 (*.npy);;所有檔案 (*)",
         )
         if not file_path:
             return
 
         try:
-            import csv
-            with open(file_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(['id', 'image_x', 'image_y', 'world_x', 'world_y'])
-                for point in self._point_data:
-                    writer.writerow(point)
+            import numpy as np
+
+            if file_path.endswith('.npy'):
+                # 結構化陣列：ID 以 int32 保存，下游可直接依欄位名稱讀取
+                np.save(file_path, _points_to_structured(self._point_data), allow_pickle=False)
+            else:
+                # 點位數據已是 ndarray，整批格式化寫出
+                np.savetxt(
+                    file_path,
+                    self._point_data,
+                    fmt=['%d', '%.6f', '%.6f', '%.6f', '%.6f'],
+                    delimiter=',',
+                    header=','.join(_POINT_FIELDS),
+                    comments='',
+                    encoding='utf-8',
+                )
 
             self.statusbar.showMessage(f"已匯出至：{file_path}")
             QMessageBox.information(self, "匯出成功", f"已匯出 {len(self._point_data)} 個點位")
@@ -3058,7 +3555,7 @@ class MainWindow(QMainWindow):
 
     @Slot()
     def _on_import_excel_data(self):
-        """匯入 Excel 數據用於外參計算"""
+        """匯入 Excel 數據用於外參計算（背景執行緒）"""
         file_path, _ = QFileDialog.getOpenFileName(
             self, "匯入Excel數據",
             "", "Excel 檔案 (*.xlsx *.xls);;所有檔案 (*)",
@@ -3067,97 +3564,78 @@ class MainWindow(QMainWindow):
             return
 
         try:
-            from openpyxl import load_workbook
+            import openpyxl  # noqa: F401
+        except ImportError:
+            QMessageBox.critical(
+                self, "缺少依賴",
+                "需要安裝 openpyxl 套件：\npip install openpyxl"
+            )
+            return
 
-            wb = load_workbook(file_path, data_only=True)
+        from vision_calib.utils.worker import ExcelImportWorker
 
-            # 尋找數據工作表（優先「標定數據」，否則使用第一個）
-            if "標定數據" in wb.sheetnames:
-                ws = wb["標定數據"]
-            else:
-                ws = wb.active
+        self.ext_import_excel_btn.setEnabled(False)
+        self.statusbar.showMessage("正在讀取 Excel 數據...")
 
-            # 讀取數據（跳過表頭）
-            imported_data = []
-            valid_count = 0
-            skip_count = 0
+        self._excel_worker = ExcelImportWorker(file_path, self)
+        self._excel_worker.finished.connect(self._on_excel_import_finished)
+        self._excel_worker.error.connect(self._on_excel_import_error)
+        self._excel_worker.start()
 
-            for row_idx, row in enumerate(ws.iter_rows(min_row=2, values_only=True), 2):
-                if row is None or all(cell is None for cell in row):
-                    continue
+    @Slot(object, int)
+    def _on_excel_import_finished(self, imported_data, skip_count: int):
+        """Excel 數據讀取完成"""
+        self._excel_worker = None
+        self.ext_import_excel_btn.setEnabled(True)
 
-                try:
-                    # 嘗試讀取各欄位
-                    point_id = row[0] if row[0] is not None else row_idx - 1
-                    img_x = row[1] if len(row) > 1 and row[1] is not None else None
-                    img_y = row[2] if len(row) > 2 and row[2] is not None else None
-                    world_x = row[3] if len(row) > 3 and row[3] is not None else None
-                    world_y = row[4] if len(row) > 4 and row[4] is not None else None
-
-                    # 檢查必要欄位是否有值
-                    if img_x is None or img_y is None or world_x is None or world_y is None:
-                        skip_count += 1
-                        continue
-
-                    # 轉換為數值
-                    imported_data.append([
-                        float(point_id),
-                        float(img_x),
-                        float(img_y),
-                        float(world_x),
-                        float(world_y)
-                    ])
-                    valid_count += 1
-
-                except (ValueError, TypeError) as e:
-                    skip_count += 1
-                    continue
-
-            wb.close()
-
-            if not imported_data:
-                QMessageBox.warning(
-                    self, "無有效數據",
-                    "Excel檔案中沒有找到有效的座標數據。\n\n"
-                    "請確認：\n"
-                    "1. 數據填寫在「標定數據」工作表\n"
-                    "2. 視覺座標和機械臂座標都已填寫\n"
-                    "3. 座標值為數字格式"
-                )
-                return
+        if not len(imported_data):
+            self.statusbar.showMessage("Excel 檔案中沒有有效數據")
+            QMessageBox.warning(
+                self, "無有效數據",
+                "Excel檔案中沒有找到有效的座標數據。\n\n"
+                "請確認：\n"
+                "1. 數據填寫在「標定數據」工作表\n"
+                "2. 視覺座標和機械臂座標都已填寫\n"
+                "3. 座標值為數字格式"
+            )
+            return
 
-            # 更新點位數據
-            self._point_data = imported_data
-            self._update_points_table()
+        valid_count = len(imported_data)
 
-            # 更新外參計算頁籤的狀態
-            self.excel_data_status.setText(f"已匯入 {valid_count} 個點位")
-            self.ext_points_status.setText(f"點位數據：{valid_count} 個點")
+        # 更新點位數據
+        self._point_data = imported_data
+        self._update_points_table()
 
-            # 自動切換到使用點位數據模式
-            self.ext_use_points_radio.setChecked(True)
+        # 更新外參計算頁籤的狀態
+        self.excel_data_status.setText(f"已匯入 {valid_count} 個點位")
+        self.ext_points_status.setText(f"點位數據：{valid_count} 個點")
 
-            # 啟用計算外參按鈕
-            self.ext_calibrate_btn.setEnabled(True)
+        # 自動切換到使用點位數據模式
+        self.ext_use_points_radio.setChecked(True)
 
-            msg = f"已成功匯入 {valid_count} 個點位"
-            if skip_count > 0:
-                msg += f"\n（跳過 {skip_count} 個無效行）"
+        # 依匯入後的點位更新計算外參按鈕
+        self._check_extrinsic_ready()
 
-            self.statusbar.showMessage(msg)
-            QMessageBox.information(self, "匯入成功", msg + "\n\n現在可以點擊「計算外參」進行計算。")
+        msg = f"已成功匯入 {valid_count} 個點位"
+        if skip_count > 0:
+            msg += f"\n（跳過 {skip_count} 個無效行）"
 
-        except ImportError:
-            QMessageBox.critical(
-                self, "缺少依賴",
-                "需要安裝 openpyxl 套件：\npip install openpyxl"
-            )
-        except Exception as e:
-            QMessageBox.critical(self, "匯入失敗", f"無法讀取Excel檔案：{e}")
+        self.statusbar.showMessage(msg)
+        QMessageBox.information(self, "匯入成功", msg + "\n\n現在可以點擊「計算外參」進行計算。")
+
+    @Slot(str)
+    def _on_excel_import_error(self, error_msg: str):
+        """Excel 數據讀取錯誤"""
+        self._excel_worker = None
+        self.ext_import_excel_btn.setEnabled(True)
+        self.statusbar.showMessage("Excel 匯入失敗")
+        QMessageBox.critical(self, "匯入失敗", f"無法讀取Excel檔案：{error_msg}")
 
     @Slot()
     def _on_load_corners_to_points(self):
         """從角點快取載入像素座標到點位數據"""
+        import numpy as np
+
         # 找到第一個有角點的圖像
         corners_data = None
         for path, corners in self._corner_cache.items():
@@ -3175,28 +3653,12 @@ class MainWindow(QMainWindow):
             )
             return
 
-        # 如果有世界座標，合併；否則只載入像素座標
-        if self._generated_world_coords:
-            if len(corners_data) != len(self._generated_world_coords):
-                QMessageBox.warning(
-                    self, "數量不匹配",
-                    f"角點數量 ({len(corners_data)}) 與世界座標數量 "
-                    f"({len(self._generated_world_coords)}) 不匹配！\n\n"
-                    "請確保棋盤格參數一致。"
-                )
-                return
+        # 角點陣列為 (N, 1, 2)，攤平成 (N, 2) 後整批組成點位數據
+        pixels = np.asarray(corners_data, dtype=np.float64).reshape(-1, 2)
 
-            self._point_data.clear()
-            for i, (corner, world) in enumerate(zip(corners_data, self._generated_world_coords)):
-                point_id = world[0]
-                img_x, img_y = corner[0], corner[1]
-                world_x, world_y = world[1], world[2]
-                self._point_data.append([point_id, img_x, img_y, world_x, world_y])
-        else:
-            # 只載入像素座標，世界座標設為 0
-            self._point_data.clear()
-            for i, corner in enumerate(corners_data):
-                self._point_data.append([i + 1, corner[0], corner[1], 0.0, 0.0])
+        # 只載入像素座標，編號依序遞增，世界座標設為 0 待使用者填入
+        ids = np.arange(1, len(pixels) + 1)
+        self._point_data = np.column_stack((ids, pixels, np.zeros_like(pixels)))
 
         self._update_points_table()
         self.statusbar.showMessage(f"已載入 {len(self._point_data)} 個點位")
@@ -3223,14 +3685,14 @@ class MainWindow(QMainWindow):
 
         try:
             import numpy as np
-            import json
 
             ext = self._extrinsic_result.extrinsic
             rvec = ext.rotation_vector.flatten()
             tvec = ext.translation_vector.flatten()
 
             if file_path.endswith('.npy'):
-                # 儲存為結構化陣列
+                # 儲存為字典（與 examples 及既有檔案相同格式，
+                # 讀取端使用 np.load(..., allow_pickle=True).item()）
                 data = {
                     'rvec': ext.rotation_vector,
                     'tvec': ext.translation_vector,
@@ -3238,15 +3700,29 @@ class MainWindow(QMainWindow):
                 }
                 np.save(file_path, data)
             else:
-                # 儲存為 JSON
+                # 儲存為 JSON（陣列直接序列化，不經 tolist）
                 data = {
-                    'rvec': rvec.tolist(),
-                    'tvec': tvec.tolist(),
-                    'rotation_matrix': ext.rotation_matrix.tolist(),
-                    'reprojection_error': self._extrinsic_result.reprojection_error,
+                    'rvec': rvec,
+                    'tvec': tvec,
+                    'rotation_matrix': ext.rotation_matrix,
+                    'reprojection_error': float(self._extrinsic_result.reprojection_error),
                 }
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2)
+                try:
+                    import orjson
+                except ImportError:
+                    orjson = None
+
+                if orjson is not None:
+                    with open(file_path, 'wb') as f:
+                        f.write(orjson.dumps(
+                            data, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2
+                        ))
+                else:
+                    import json
+                    from vision_calib.io.formats.json_format import NumpyEncoder
+
+                    with open(file_path, 'w', encoding='utf-8') as f:
+                        json.dump(data, f, indent=2, cls=NumpyEncoder)
 
             self.statusbar.showMessage(f"已匯出至：{file_path}")
             QMessageBox.information(self, "匯出成功", f"外參已儲存至：\n{file_path}")
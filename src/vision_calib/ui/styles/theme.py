@@ -6,13 +6,19 @@ Implements Google's Material Design 3 color scheme with light/dark modes.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import weakref
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass
 from enum import Enum
+from functools import lru_cache
+from string import Template
+from types import MappingProxyType
 from typing import Callable
 
+import shiboken6
 from PySide6.QtCore import QObject, Signal
 from PySide6.QtGui import QFont, QFontDatabase
-from PySide6.QtWidgets import QApplication
+from PySide6.QtWidgets import QApplication, QWidget
 
 
 class Theme(Enum):
@@ -21,9 +27,9 @@ class Theme(Enum):
     DARK = "dark"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ThemeColors:
-    """Material Design 3 color palette."""
+    """Material Design 3 color palette (immutable, usable as a cache key)."""
     # Primary
     primary: str
     on_primary: str
@@ -155,426 +161,481 @@ DARK_COLORS = ThemeColors(
 )
 
 
+# Widget classes styled per widget instead of through the application
+# stylesheet; only a handful of these exist, so keeping their selectors out
+# of the global sheet shrinks what Qt matches on every polish.
+LOCAL_STYLE_CLASSES = frozenset({"QTextEdit", "QProgressBar", "QGraphicsView"})
+
+
+# QSS templates keyed by widget class. Placeholders are ThemeColors field
+# names, so a palette fills them in with a single substitute() call.
+_QSS_TEMPLATES: Mapping[str, Template] = MappingProxyType({
+    "global": Template("""
+/* ===== Global ===== */
+QMainWindow, QWidget {
+    background-color: ${background};
+    color: ${on_background};
+    font-family: "Microsoft JhengHei UI", "Segoe UI", "Roboto", sans-serif;
+    font-size: 14px;
+}
+
+/* ===== Menu Bar ===== */
+QMenuBar {
+    background-color: ${surface};
+    color: ${on_surface};
+    border-bottom: 1px solid ${outline};
+    padding: 4px 0;
+    font-size: 14px;
+}
+
+QMenuBar::item {
+    padding: 8px 16px;
+    border-radius: 4px;
+    margin: 2px 4px;
+}
+
+QMenuBar::item:selected {
+    background-color: ${surface_variant};
+}
+
+QMenu {
+    background-color: ${surface_container};
+    color: ${on_surface};
+    border: 1px solid ${outline};
+    border-radius: 8px;
+    padding: 8px 0;
+}
+
+QMenu::item {
+    padding: 10px 24px;
+    margin: 2px 8px;
+    border-radius: 4px;
+}
+
+QMenu::item:selected {
+    background-color: ${primary_container};
+    color: ${on_primary_container};
+}
+
+/* ===== Tool Bar ===== */
+QToolBar {
+    background-color: ${surface};
+    border-bottom: 1px solid ${outline};
+    padding: 8px;
+    spacing: 8px;
+}
+
+QToolBar QToolButton {
+    background-color: transparent;
+    color: ${on_surface};
+    border: none;
+    border-radius: 8px;
+    padding: 10px 16px;
+    font-size: 14px;
+    font-weight: 500;
+}
+
+QToolBar QToolButton:hover {
+    background-color: ${surface_variant};
+}
+
+QToolBar QToolButton:pressed {
+    background-color: ${primary_container};
+}
+
+/* ===== Status Bar ===== */
+QStatusBar {
+    background-color: ${surface};
+    color: ${on_surface_variant};
+    border-top: 1px solid ${outline};
+    padding: 8px 16px;
+    font-size: 13px;
+}
+"""),
+    "QPushButton": Template("""
+/* ===== Buttons ===== */
+QPushButton {
+    background-color: ${primary};
+    color: ${on_primary};
+    border: none;
+    border-radius: 20px;
+    padding: 12px 24px;
+    font-size: 14px;
+    font-weight: 500;
+    min-height: 20px;
+}
+
+QPushButton:hover {
+    background-color: ${primary};
+    opacity: 0.92;
+}
+
+QPushButton:pressed {
+    background-color: ${primary_container};
+    color: ${on_primary_container};
+}
+
+QPushButton:disabled {
+    background-color: ${surface_variant};
+    color: ${on_surface_variant};
+}
+
+/* Secondary Button */
+QPushButton[secondary="true"] {
+    background-color: transparent;
+    color: ${primary};
+    border: 1px solid ${outline};
+}
+
+QPushButton[secondary="true"]:hover {
+    background-color: ${primary_container};
+}
+"""),
+    "QGroupBox": Template("""
+/* ===== Group Box ===== */
+QGroupBox {
+    background-color: ${surface_container};
+    border: 1px solid ${outline};
+    border-radius: 12px;
+    margin-top: 16px;
+    padding: 20px 16px 16px 16px;
+    font-size: 14px;
+    font-weight: 500;
+}
+
+QGroupBox::title {
+    subcontrol-origin: margin;
+    subcontrol-position: top left;
+    left: 16px;
+    top: 4px;
+    color: ${on_surface};
+    background-color: ${surface_container};
+    padding: 4px 8px;
+    font-size: 13px;
+    font-weight: 600;
+}
+"""),
+    "QSpinBox": Template("""
+/* ===== Spin Box ===== */
+QSpinBox, QDoubleSpinBox {
+    background-color: ${surface_container};
+    color: ${on_surface};
+    border: 1px solid ${outline};
+    border-radius: 8px;
+    padding: 10px 12px;
+    font-size: 14px;
+    min-height: 20px;
+}
+
+QSpinBox:focus, QDoubleSpinBox:focus {
+    border: 2px solid ${primary};
+}
+
+QSpinBox::up-button, QDoubleSpinBox::up-button,
+QSpinBox::down-button, QDoubleSpinBox::down-button {
+    background-color: transparent;
+    border: none;
+    width: 24px;
+}
+
+QSpinBox::up-arrow, QDoubleSpinBox::up-arrow {
+    image: none;
+    border-left: 5px solid transparent;
+    border-right: 5px solid transparent;
+    border-bottom: 6px solid ${on_surface_variant};
+}
+
+QSpinBox::down-arrow, QDoubleSpinBox::down-arrow {
+    image: none;
+    border-left: 5px solid transparent;
+    border-right: 5px solid transparent;
+    border-top: 6px solid ${on_surface_variant};
+}
+"""),
+    "QListWidget": Template("""
+/* ===== List Widget ===== */
+QListWidget {
+    background-color: ${surface_container};
+    color: ${on_surface};
+    border: 1px solid ${outline};
+    border-radius: 8px;
+    padding: 8px;
+    font-size: 14px;
+    outline: none;
+}
+
+QListWidget::item {
+    padding: 10px 12px;
+    border-radius: 6px;
+    margin: 2px 0;
+}
+
+QListWidget::item:selected {
+    background-color: ${primary_container};
+    color: ${on_primary_container};
+}
+
+QListWidget::item:hover {
+    background-color: ${surface_variant};
+}
+"""),
+    "QTabWidget": Template("""
+/* ===== Tab Widget ===== */
+QTabWidget::pane {
+    background-color: ${surface};
+    border: 1px solid ${outline};
+    border-radius: 12px;
+    padding: 8px;
+}
+
+QTabBar::tab {
+    background-color: transparent;
+    color: ${on_surface_variant};
+    border: none;
+    padding: 14px 24px;
+    font-size: 14px;
+    font-weight: 500;
+    margin-right: 4px;
+}
+
+QTabBar::tab:selected {
+    color: ${primary};
+    border-bottom: 3px solid ${primary};
+}
+
+QTabBar::tab:hover:!selected {
+    background-color: ${surface_variant};
+    border-radius: 8px 8px 0 0;
+}
+"""),
+    "QTextEdit": Template("""
+/* ===== Text Edit ===== */
+QTextEdit {
+    background-color: ${surface_container};
+    color: ${on_surface};
+    border: 1px solid ${outline};
+    border-radius: 12px;
+    padding: 16px;
+    font-size: 14px;
+    line-height: 1.6;
+}
+
+QTextEdit:focus {
+    border: 2px solid ${primary};
+}
+"""),
+    "QProgressBar": Template("""
+/* ===== Progress Bar ===== */
+QProgressBar {
+    background-color: ${surface_variant};
+    border: none;
+    border-radius: 4px;
+    height: 8px;
+    text-align: center;
+}
+
+QProgressBar::chunk {
+    background-color: ${primary};
+    border-radius: 4px;
+}
+"""),
+    "QSplitter": Template("""
+/* ===== Splitter ===== */
+QSplitter::handle {
+    background-color: ${outline};
+    width: 1px;
+    margin: 0 8px;
+}
+
+QSplitter::handle:hover {
+    background-color: ${primary};
+}
+"""),
+    "QScrollArea": Template("""
+/* ===== Scroll Area ===== */
+QScrollArea {
+    background-color: transparent;
+    border: none;
+}
+
+QScrollArea > QWidget > QWidget {
+    background-color: transparent;
+}
+"""),
+    "QScrollBar": Template("""
+/* ===== Scroll Bar ===== */
+QScrollBar:vertical {
+    background-color: transparent;
+    width: 12px;
+    margin: 4px;
+}
+
+QScrollBar::handle:vertical {
+    background-color: ${outline_variant};
+    border-radius: 4px;
+    min-height: 40px;
+}
+
+QScrollBar::handle:vertical:hover {
+    background-color: ${outline};
+}
+
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+    height: 0;
+}
+
+QScrollBar:horizontal {
+    background-color: transparent;
+    height: 12px;
+    margin: 4px;
+}
+
+QScrollBar::handle:horizontal {
+    background-color: ${outline_variant};
+    border-radius: 4px;
+    min-width: 40px;
+}
+
+QScrollBar::handle:horizontal:hover {
+    background-color: ${outline};
+}
+
+QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
+    width: 0;
+}
+"""),
+    "QMessageBox": Template("""
+/* ===== Message Box ===== */
+QMessageBox {
+    background-color: ${surface};
+}
+
+QMessageBox QLabel {
+    color: ${on_surface};
+    font-size: 14px;
+    padding: 8px;
+}
+"""),
+    "QFileDialog": Template("""
+/* ===== File Dialog ===== */
+QFileDialog {
+    background-color: ${surface};
+}
+"""),
+    "QLabel": Template("""
+/* ===== Labels ===== */
+QLabel {
+    color: ${on_surface};
+    font-size: 14px;
+}
+
+QLabel[heading="true"] {
+    font-size: 20px;
+    font-weight: 600;
+    color: ${on_surface};
+}
+
+QLabel[subheading="true"] {
+    font-size: 16px;
+    font-weight: 500;
+    color: ${on_surface_variant};
+}
+"""),
+    "QFormLayout": Template("""
+/* ===== Form Layout ===== */
+QFormLayout {
+    spacing: 12px;
+}
+"""),
+    "QToolTip": Template("""
+/* ===== Tool Tip ===== */
+QToolTip {
+    background-color: ${surface_container_high};
+    color: ${on_surface};
+    border: 1px solid ${outline};
+    border-radius: 8px;
+    padding: 8px 12px;
+    font-size: 13px;
+}
+"""),
+    "QComboBox": Template("""
+/* ===== Combo Box ===== */
+QComboBox {
+    background-color: ${surface_container};
+    color: ${on_surface};
+    border: 1px solid ${outline};
+    border-radius: 8px;
+    padding: 10px 12px;
+    font-size: 14px;
+    min-height: 20px;
+}
+
+QComboBox:focus {
+    border: 2px solid ${primary};
+}
+
+QComboBox::drop-down {
+    border: none;
+    width: 24px;
+}
+
+QComboBox::down-arrow {
+    image: none;
+    border-left: 5px solid transparent;
+    border-right: 5px solid transparent;
+    border-top: 6px solid ${on_surface_variant};
+}
+
+QComboBox QAbstractItemView {
+    background-color: ${surface_container};
+    color: ${on_surface};
+    border: 1px solid ${outline};
+    border-radius: 8px;
+    padding: 8px;
+    selection-background-color: ${primary_container};
+    selection-color: ${on_primary_container};
+    font-size: 14px;
+}
+"""),
+    "QGraphicsView": Template("""
+/* ===== Graphics View ===== */
+QGraphicsView {
+    background-color: ${surface_container};
+    border: 1px solid ${outline};
+    border-radius: 8px;
+}
+"""),
+})
+
+
+@lru_cache(maxsize=4)
+def get_stylesheet_fragments(colors: ThemeColors) -> Mapping[str, str]:
+    """Generate QSS fragments from theme colors, keyed by widget class.
+
+    The ``"global"`` fragment holds the window chrome (main window, menu bar,
+    tool bar, status bar). Classes listed in ``LOCAL_STYLE_CLASSES`` are not
+    part of the application stylesheet; widgets of those classes pull their
+    fragment through ``ThemeManager.apply_local_style``.
+    """
+    values = asdict(colors)
+    return MappingProxyType({
+        cls_name: template.substitute(values)
+        for cls_name, template in _QSS_TEMPLATES.items()
+    })
+
+
+@lru_cache(maxsize=4)
 def get_stylesheet(colors: ThemeColors) -> str:
-    """Generate QSS stylesheet from theme colors."""
-    return f"""
-    /* ===== Global ===== */
-    QMainWindow, QWidget {{
-        background-color: {colors.background};
-        color: {colors.on_background};
-        font-family: "Microsoft JhengHei UI", "Segoe UI", "Roboto", sans-serif;
-        font-size: 14px;
-    }}
-
-    /* ===== Menu Bar ===== */
-    QMenuBar {{
-        background-color: {colors.surface};
-        color: {colors.on_surface};
-        border-bottom: 1px solid {colors.outline};
-        padding: 4px 0;
-        font-size: 14px;
-    }}
-
-    QMenuBar::item {{
-        padding: 8px 16px;
-        border-radius: 4px;
-        margin: 2px 4px;
-    }}
-
-    QMenuBar::item:selected {{
-        background-color: {colors.surface_variant};
-    }}
-
-    QMenu {{
-        background-color: {colors.surface_container};
-        color: {colors.on_surface};
-        border: 1px solid {colors.outline};
-        border-radius: 8px;
-        padding: 8px 0;
-    }}
-
-    QMenu::item {{
-        padding: 10px 24px;
-        margin: 2px 8px;
-        border-radius: 4px;
-    }}
-
-    QMenu::item:selected {{
-        background-color: {colors.primary_container};
-        color: {colors.on_primary_container};
-    }}
-
-    /* ===== Tool Bar ===== */
-    QToolBar {{
-        background-color: {colors.surface};
-        border-bottom: 1px solid {colors.outline};
-        padding: 8px;
-        spacing: 8px;
-    }}
-
-    QToolBar QToolButton {{
-        background-color: transparent;
-        color: {colors.on_surface};
-        border: none;
-        border-radius: 8px;
-        padding: 10px 16px;
-        font-size: 14px;
-        font-weight: 500;
-    }}
-
-    QToolBar QToolButton:hover {{
-        background-color: {colors.surface_variant};
-    }}
-
-    QToolBar QToolButton:pressed {{
-        background-color: {colors.primary_container};
-    }}
-
-    /* ===== Status Bar ===== */
-    QStatusBar {{
-        background-color: {colors.surface};
-        color: {colors.on_surface_variant};
-        border-top: 1px solid {colors.outline};
-        padding: 8px 16px;
-        font-size: 13px;
-    }}
-
-    /* ===== Buttons ===== */
-    QPushButton {{
-        background-color: {colors.primary};
-        color: {colors.on_primary};
-        border: none;
-        border-radius: 20px;
-        padding: 12px 24px;
-        font-size: 14px;
-        font-weight: 500;
-        min-height: 20px;
-    }}
-
-    QPushButton:hover {{
-        background-color: {colors.primary};
-        opacity: 0.92;
-    }}
-
-    QPushButton:pressed {{
-        background-color: {colors.primary_container};
-        color: {colors.on_primary_container};
-    }}
-
-    QPushButton:disabled {{
-        background-color: {colors.surface_variant};
-        color: {colors.on_surface_variant};
-    }}
-
-    /* Secondary Button */
-    QPushButton[secondary="true"] {{
-        background-color: transparent;
-        color: {colors.primary};
-        border: 1px solid {colors.outline};
-    }}
-
-    QPushButton[secondary="true"]:hover {{
-        background-color: {colors.primary_container};
-    }}
-
-    /* ===== Group Box ===== */
-    QGroupBox {{
-        background-color: {colors.surface_container};
-        border: 1px solid {colors.outline};
-        border-radius: 12px;
-        margin-top: 16px;
-        padding: 20px 16px 16px 16px;
-        font-size: 14px;
-        font-weight: 500;
-    }}
-
-    QGroupBox::title {{
-        subcontrol-origin: margin;
-        subcontrol-position: top left;
-        left: 16px;
-        top: 4px;
-        color: {colors.on_surface};
-        background-color: {colors.surface_container};
-        padding: 4px 8px;
-        font-size: 13px;
-        font-weight: 600;
-    }}
-
-    /* ===== Spin Box ===== */
-    QSpinBox, QDoubleSpinBox {{
-        background-color: {colors.surface_container};
-        color: {colors.on_surface};
-        border: 1px solid {colors.outline};
-        border-radius: 8px;
-        padding: 10px 12px;
-        font-size: 14px;
-        min-height: 20px;
-    }}
-
-    QSpinBox:focus, QDoubleSpinBox:focus {{
-        border: 2px solid {colors.primary};
-    }}
-
-    QSpinBox::up-button, QDoubleSpinBox::up-button,
-    QSpinBox::down-button, QDoubleSpinBox::down-button {{
-        background-color: transparent;
-        border: none;
-        width: 24px;
-    }}
-
-    QSpinBox::up-arrow, QDoubleSpinBox::up-arrow {{
-        image: none;
-        border-left: 5px solid transparent;
-        border-right: 5px solid transparent;
-        border-bottom: 6px solid {colors.on_surface_variant};
-    }}
-
-    QSpinBox::down-arrow, QDoubleSpinBox::down-arrow {{
-        image: none;
-        border-left: 5px solid transparent;
-        border-right: 5px solid transparent;
-        border-top: 6px solid {colors.on_surface_variant};
-    }}
-
-    /* ===== List Widget ===== */
-    QListWidget {{
-        background-color: {colors.surface_container};
-        color: {colors.on_surface};
-        border: 1px solid {colors.outline};
-        border-radius: 8px;
-        padding: 8px;
-        font-size: 14px;
-        outline: none;
-    }}
-
-    QListWidget::item {{
-        padding: 10px 12px;
-        border-radius: 6px;
-        margin: 2px 0;
-    }}
-
-    QListWidget::item:selected {{
-        background-color: {colors.primary_container};
-        color: {colors.on_primary_container};
-    }}
-
-    QListWidget::item:hover {{
-        background-color: {colors.surface_variant};
-    }}
-
-    /* ===== Tab Widget ===== */
-    QTabWidget::pane {{
-        background-color: {colors.surface};
-        border: 1px solid {colors.outline};
-        border-radius: 12px;
-        padding: 8px;
-    }}
-
-    QTabBar::tab {{
-        background-color: transparent;
-        color: {colors.on_surface_variant};
-        border: none;
-        padding: 14px 24px;
-        font-size: 14px;
-        font-weight: 500;
-        margin-right: 4px;
-    }}
-
-    QTabBar::tab:selected {{
-        color: {colors.primary};
-        border-bottom: 3px solid {colors.primary};
-    }}
-
-    QTabBar::tab:hover:!selected {{
-        background-color: {colors.surface_variant};
-        border-radius: 8px 8px 0 0;
-    }}
-
-    /* ===== Text Edit ===== */
-    QTextEdit {{
-        background-color: {colors.surface_container};
-        color: {colors.on_surface};
-        border: 1px solid {colors.outline};
-        border-radius: 12px;
-        padding: 16px;
-        font-size: 14px;
-        line-height: 1.6;
-    }}
-
-    QTextEdit:focus {{
-        border: 2px solid {colors.primary};
-    }}
-
-    /* ===== Progress Bar ===== */
-    QProgressBar {{
-        background-color: {colors.surface_variant};
-        border: none;
-        border-radius: 4px;
-        height: 8px;
-        text-align: center;
-    }}
-
-    QProgressBar::chunk {{
-        background-color: {colors.primary};
-        border-radius: 4px;
-    }}
-
-    /* ===== Splitter ===== */
-    QSplitter::handle {{
-        background-color: {colors.outline};
-        width: 1px;
-        margin: 0 8px;
-    }}
-
-    QSplitter::handle:hover {{
-        background-color: {colors.primary};
-    }}
-
-    /* ===== Scroll Area ===== */
-    QScrollArea {{
-        background-color: transparent;
-        border: none;
-    }}
-
-    QScrollArea > QWidget > QWidget {{
-        background-color: transparent;
-    }}
-
-    /* ===== Scroll Bar ===== */
-    QScrollBar:vertical {{
-        background-color: transparent;
-        width: 12px;
-        margin: 4px;
-    }}
-
-    QScrollBar::handle:vertical {{
-        background-color: {colors.outline_variant};
-        border-radius: 4px;
-        min-height: 40px;
-    }}
-
-    QScrollBar::handle:vertical:hover {{
-        background-color: {colors.outline};
-    }}
-
-    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-        height: 0;
-    }}
-
-    QScrollBar:horizontal {{
-        background-color: transparent;
-        height: 12px;
-        margin: 4px;
-    }}
-
-    QScrollBar::handle:horizontal {{
-        background-color: {colors.outline_variant};
-        border-radius: 4px;
-        min-width: 40px;
-    }}
-
-    QScrollBar::handle:horizontal:hover {{
-        background-color: {colors.outline};
-    }}
-
-    QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
-        width: 0;
-    }}
-
-    /* ===== Message Box ===== */
-    QMessageBox {{
-        background-color: {colors.surface};
-    }}
-
-    QMessageBox QLabel {{
-        color: {colors.on_surface};
-        font-size: 14px;
-        padding: 8px;
-    }}
-
-    /* ===== File Dialog ===== */
-    QFileDialog {{
-        background-color: {colors.surface};
-    }}
-
-    /* ===== Labels ===== */
-    QLabel {{
-        color: {colors.on_surface};
-        font-size: 14px;
-    }}
-
-    QLabel[heading="true"] {{
-        font-size: 20px;
-        font-weight: 600;
-        color: {colors.on_surface};
-    }}
-
-    QLabel[subheading="true"] {{
-        font-size: 16px;
-        font-weight: 500;
-        color: {colors.on_surface_variant};
-    }}
-
-    /* ===== Form Layout ===== */
-    QFormLayout {{
-        spacing: 12px;
-    }}
-
-    /* ===== Tool Tip ===== */
-    QToolTip {{
-        background-color: {colors.surface_container_high};
-        color: {colors.on_surface};
-        border: 1px solid {colors.outline};
-        border-radius: 8px;
-        padding: 8px 12px;
-        font-size: 13px;
-    }}
-
-    /* ===== Combo Box ===== */
-    QComboBox {{
-        background-color: {colors.surface_container};
-        color: {colors.on_surface};
-        border: 1px solid {colors.outline};
-        border-radius: 8px;
-        padding: 10px 12px;
-        font-size: 14px;
-        min-height: 20px;
-    }}
-
-    QComboBox:focus {{
-        border: 2px solid {colors.primary};
-    }}
-
-    QComboBox::drop-down {{
-        border: none;
-        width: 24px;
-    }}
-
-    QComboBox::down-arrow {{
-        image: none;
-        border-left: 5px solid transparent;
-        border-right: 5px solid transparent;
-        border-top: 6px solid {colors.on_surface_variant};
-    }}
-
-    QComboBox QAbstractItemView {{
-        background-color: {colors.surface_container};
-        color: {colors.on_surface};
-        border: 1px solid {colors.outline};
-        border-radius: 8px;
-        padding: 8px;
-        selection-background-color: {colors.primary_container};
-        selection-color: {colors.on_primary_container};
-        font-size: 14px;
-    }}
-
-    /* ===== Graphics View ===== */
-    QGraphicsView {{
-        background-color: {colors.surface_container};
-        border: 1px solid {colors.outline};
-        border-radius: 8px;
-    }}
+    """Generate the application-level QSS stylesheet from theme colors.
+
+    The result is cached per palette, so toggling between the built-in
+    themes does not rebuild the stylesheet string.
     """
+    fragments = get_stylesheet_fragments(colors)
+    return "".join(
+        qss for cls_name, qss in fragments.items()
+        if cls_name not in LOCAL_STYLE_CLASSES
+    )
 
 
 class ThemeManager(QObject):
@@ -603,6 +664,10 @@ class ThemeManager(QObject):
             return
         super().__init__()
         self._current_theme = Theme.LIGHT
+        self._last_applied: Theme | None = None
+        self._local_widgets: weakref.WeakKeyDictionary[QWidget, str] = (
+            weakref.WeakKeyDictionary()
+        )
         self._initialized = True
 
     @property
@@ -626,11 +691,7 @@ class ThemeManager(QObject):
             return
 
         self._current_theme = theme
-        colors = LIGHT_COLORS if theme == Theme.LIGHT else DARK_COLORS
-
-        app = QApplication.instance()
-        if app:
-            app.setStyleSheet(get_stylesheet(colors))
+        self.apply_current_theme()
 
         self.theme_changed.emit(theme)
 
@@ -640,8 +701,28 @@ class ThemeManager(QObject):
         self.set_theme(new_theme)
 
     def apply_current_theme(self) -> None:
-        """Apply current theme to application."""
-        colors = LIGHT_COLORS if self._current_theme == Theme.LIGHT else DARK_COLORS
+        """Apply current theme to application.
+
+        Does nothing if the current theme is already applied, since every
+        setStyleSheet call re-polishes all widgets.
+        """
+        if self._last_applied == self._current_theme:
+            return
+
         app = QApplication.instance()
         if app:
-            app.setStyleSheet(get_stylesheet(colors))
+            app.setStyleSheet(get_stylesheet(self.colors))
+            self._last_applied = self._current_theme
+
+        for widget, cls_name in list(self._local_widgets.items()):
+            if shiboken6.isValid(widget):
+                widget.setStyleSheet(self.stylesheet_for(cls_name))
+
+    def stylesheet_for(self, cls_name: str) -> str:
+        """Get the current theme's QSS fragment for a widget class."""
+        return get_stylesheet_fragments(self.colors).get(cls_name, "")
+
+    def apply_local_style(self, widget: QWidget, cls_name: str) -> None:
+        """Style a widget with its own fragment and keep it in sync with the theme."""
+        self._local_widgets[widget] = cls_name
+        widget.setStyleSheet(self.stylesheet_for(cls_name))
@@ -5,6 +5,7 @@ from vision_calib.utils.worker import (
     CalibrationWorker,
     CornerDetectionWorker,
     CornerDetectionResult,
+    ExcelImportWorker,
 )
 
 __all__ = [
@@ -12,4 +13,5 @@ __all__ = [
     "CalibrationWorker",
     "CornerDetectionWorker",
     "CornerDetectionResult",
+    "ExcelImportWorker",
 ]
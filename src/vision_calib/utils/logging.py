@@ -5,11 +5,44 @@ Provides a consistent logging setup across the application,
 replacing print statements with proper logging.
 """
 
+import atexit
 import logging
+import queue
 import sys
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional
 
+DEFAULT_FORMAT = "[%(asctime)s] %(levelname)s - %(name)s - %(message)s"
+
+# Arguments of the last setup_logging call, used to skip identical reconfiguration
+_configured_with: Optional[tuple] = None
+
+# Background listener that owns the console/file handlers
+_listener: Optional[QueueListener] = None
+
+
+@lru_cache(maxsize=4)
+def _get_formatter(format_string: str) -> logging.Formatter:
+    """Get a shared formatter for a format string."""
+    return logging.Formatter(format_string, datefmt="%Y-%m-%d %H:%M:%S")
+
+
+def _stop_listener() -> None:
+    """Stop the background listener and close its handlers."""
+    global _listener
+
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
+atexit.register(_stop_listener)
+
 
 def setup_logging(
     level: int = logging.INFO,
@@ -23,36 +56,60 @@ def setup_logging(
         log_file: Optional path to log file.
         format_string: Optional custom format string.
 
+    Records are handed to a queue and written by a background listener,
+    so logging from worker threads never waits on console or file I/O.
+    Calling it again with the same arguments leaves the existing handlers
+    in place.
+
     Returns:
         Configured logger instance.
     """
+    global _configured_with, _listener
+
     logger = logging.getLogger("vision_calib")
+
+    # Default format
+    if format_string is None:
+        format_string = DEFAULT_FORMAT
+
+    if log_file is not None:
+        log_file = Path(log_file)
+
+    config_key = (level, log_file, format_string)
+    if config_key == _configured_with and logger.handlers:
+        return logger
+
     logger.setLevel(level)
 
     # Clear existing handlers
+    _stop_listener()
+    for handler in logger.handlers:
+        handler.close()
     logger.handlers.clear()
 
-    # Default format
-    if format_string is None:
-        format_string = "[%(asctime)s] %(levelname)s - %(name)s - %(message)s"
-
-    formatter = logging.Formatter(format_string, datefmt="%Y-%m-%d %H:%M:%S")
+    formatter = _get_formatter(format_string)
+    handlers: list[logging.Handler] = []
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers.append(console_handler)
 
     # File handler (optional)
     if log_file is not None:
-        log_file = Path(log_file)
         log_file.parent.mkdir(parents=True, exist_ok=True)
         file_handler = logging.FileHandler(log_file, encoding="utf-8")
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
 
+    _configured_with = config_key
     return logger
 
 
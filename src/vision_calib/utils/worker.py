@@ -6,12 +6,29 @@
 
 from __future__ import annotations
 
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Callable, List, Optional
 
 from PySide6.QtCore import QThread, Signal
 
 
+@lru_cache(maxsize=8)
+def _get_detector(checkerboard_config):
+    """取得共用的角點偵測器
+
+    CheckerboardConfig 為不可變且可雜湊，直接作為快取鍵；
+    CornerDetector 不保存逐張狀態，可供多個執行緒同時呼叫 detect。
+    """
+    from vision_calib.core.corner_detector import CornerDetector
+
+    return CornerDetector(checkerboard_config)
+
+
 @dataclass
 class CornerDetectionTask:
     """角點偵測任務"""
@@ -30,14 +47,22 @@ class CornerDetectionResult:
 
 
 class CornerDetectionWorker(QThread):
-    """角點偵測背景工作執行緒"""
+    """角點偵測背景工作執行緒
+
+    跨執行緒訊號每次發送都會在主執行緒排入一個事件，
+    因此逐張結果會累積成批次，依時間或數量節流後才送出。
+    """
 
     # 訊號
-    progress = Signal(int, int, str)  # (current, total, message)
-    single_result = Signal(object)  # CornerDetectionResult
+    progress = Signal(int, int)  # (current, total)，文字由 GUI 端組成
+    batch_result = Signal(list)  # list[CornerDetectionResult]
     finished = Signal(int, int)  # (success_count, total_count)
     error = Signal(str)
 
+    # 批次送出的節流條件
+    EMIT_INTERVAL = 0.05  # 秒
+    EMIT_BATCH_SIZE = 16
+
     def __init__(
         self,
         image_paths: List[str],
@@ -47,43 +72,74 @@ class CornerDetectionWorker(QThread):
         super().__init__(parent)
         self.image_paths = image_paths
         self.checkerboard_config = checkerboard_config
-        self._is_cancelled = False
+        self._cancel = threading.Event()
+        self._last_emit = 0.0
+        self._batch: List[CornerDetectionResult] = []
 
     def cancel(self):
         """取消任務"""
-        self._is_cancelled = True
+        self._cancel.set()
+
+    def _flush(self, done: int, total: int):
+        """送出累積的結果與進度"""
+        if self._batch:
+            self.batch_result.emit(self._batch.copy())
+            self._batch.clear()
+        self.progress.emit(done, total)
+        self._last_emit = time.monotonic()
 
     def run(self):
-        """執行角點偵測"""
-        from vision_calib.core.corner_detector import CornerDetector
+        """執行角點偵測
 
+        各圖像的偵測互不相依，且 OpenCV 在運算期間會釋放 GIL，
+        因此以執行緒池平行處理；結果依完成順序送出，並附帶原始索引。
+        """
         try:
-            detector = CornerDetector(self.checkerboard_config)
+            detector = _get_detector(self.checkerboard_config)
             total = len(self.image_paths)
             success_count = 0
-
-            for i, path in enumerate(self.image_paths):
-                if self._is_cancelled:
-                    break
-
-                self.progress.emit(i, total, f"正在偵測 ({i + 1}/{total})...")
-
-                result = detector.detect(path)
-
-                detection_result = CornerDetectionResult(
-                    index=i,
-                    image_path=path,
-                    success=result.success,
-                    corners=result.corners if result.success else None,
-                    message="" if result.success else "偵測失敗",
-                )
-
-                if result.success:
-                    success_count += 1
-
-                self.single_result.emit(detection_result)
-
-            self.progress.emit(total, total, "偵測完成")
+            done = 0
+
+            self._flush(0, total)
+
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                futures = {
+                    executor.submit(detector.detect, path): (i, path)
+                    for i, path in enumerate(self.image_paths)
+                }
+
+                for future in as_completed(futures):
+                    if self._cancel.is_set():
+                        for f in futures:
+                            f.cancel()
+                        break
+
+                    # 取出後即自字典移除，已完成的 future 連同其角點陣列
+                    # 不會留存到整批偵測結束
+                    i, path = futures.pop(future)
+                    result = future.result()
+                    del future
+
+                    self._batch.append(CornerDetectionResult(
+                        index=i,
+                        image_path=path,
+                        success=result.success,
+                        corners=result.corners if result.success else None,
+                        message="" if result.success else "偵測失敗",
+                    ))
+
+                    if result.success:
+                        success_count += 1
+                    del result
+
+                    done += 1
+                    if (
+                        len(self._batch) >= self.EMIT_BATCH_SIZE
+                        or time.monotonic() - self._last_emit > self.EMIT_INTERVAL
+                    ):
+                        self._flush(done, total)
+
+            self._flush(done, total)
             self.finished.emit(success_count, total)
 
         except Exception as e:
@@ -107,29 +163,41 @@ class CalibrationWorker(QThread):
         super().__init__(parent)
         self.image_paths = image_paths
         self.calibration_config = calibration_config
-        self._is_cancelled = False
+        self._cancel = threading.Event()
 
     def cancel(self):
         """取消任務"""
-        self._is_cancelled = True
+        self._cancel.set()
 
     def run(self):
         """執行標定計算"""
         from vision_calib.core.intrinsic import IntrinsicCalibrator
+        from vision_calib.core.types import CalibrationCancelledError
 
         try:
             calibrator = IntrinsicCalibrator(self.calibration_config)
 
-            # 載入圖像
+            # 載入圖像：讀檔與角點偵測在執行緒池平行進行，
+            # 結果依原始順序逐一加入標定器
+            detector = _get_detector(self.calibration_config.checkerboard)
             total_images = len(self.image_paths)
-            for i, path in enumerate(self.image_paths):
-                if self._is_cancelled:
-                    return
+            self.progress.emit(0, total_images + 1, f"載入圖像 (0/{total_images})...")
+
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                futures = [executor.submit(detector.detect, path) for path in self.image_paths]
 
-                self.progress.emit(i, total_images + 1, f"載入圖像 ({i + 1}/{total_images})...")
-                calibrator.add_image(path)
+                for i, future in enumerate(futures):
+                    if self._cancel.is_set():
+                        for f in futures[i:]:
+                            f.cancel()
+                        return
 
-            if self._is_cancelled:
+                    calibrator.add_detection(future.result())
+                    self.progress.emit(
+                        i + 1, total_images + 1, f"載入圖像 ({i + 1}/{total_images})..."
+                    )
+
+            if self._cancel.is_set():
                 return
 
             # 檢查是否可以標定
@@ -143,13 +211,94 @@ class CalibrationWorker(QThread):
             self.progress.emit(total_images, total_images + 1, "正在計算標定參數...")
 
             def progress_callback(current, total, message):
-                if not self._is_cancelled:
-                    self.progress.emit(current, total, message)
+                # 回傳 True 時標定器會在下一個步驟前中止
+                if self._cancel.is_set():
+                    return True
+                self.progress.emit(current, total, message)
+                return False
 
             result = calibrator.calibrate(progress_callback=progress_callback)
 
-            if not self._is_cancelled:
+            if not self._cancel.is_set():
                 self.finished.emit(result)
 
+        except CalibrationCancelledError:
+            pass
+        except Exception as e:
+            self.error.emit(str(e))
+
+
+class ExcelImportWorker(QThread):
+    """Excel 點位匯入背景工作執行緒
+
+    openpyxl 解析工作表是純 Python 運算，數千列以上的檔案需時近秒，
+    移至背景執行緒讓介面在讀取期間仍可操作。
+    """
+
+    # 訊號
+    finished = Signal(object, int)  # (ndarray (N, 5) [id, 視覺X, 視覺Y, 機械臂X, 機械臂Y], 跳過列數)
+    error = Signal(str)
+
+    def __init__(self, file_path: str, parent=None):
+        super().__init__(parent)
+        self.file_path = file_path
+
+    def run(self):
+        """讀取 Excel 點位數據"""
+        import numpy as np
+
+        try:
+            from openpyxl import load_workbook
+
+            # 唯讀模式以串流方式解析工作表，不建立整份活頁簿的儲存格物件；
+            # 此模式會持有檔案代碼直到 close()，例外時也必須關閉
+            wb = load_workbook(self.file_path, read_only=True, data_only=True)
+            try:
+                # 尋找數據工作表（優先「標定數據」，否則使用第一個）
+                if "標定數據" in wb.sheetnames:
+                    ws = wb["標定數據"]
+                else:
+                    ws = wb.active
+
+                # 讀取數據（跳過表頭）
+                imported_data = []
+                skip_count = 0
+
+                # 只需前 5 欄（ID、視覺 X/Y、機械臂 X/Y），其餘備註欄不解析
+                for row_idx, row in enumerate(ws.iter_rows(min_row=2, max_col=5, values_only=True), 2):
+                    if row is None or all(cell is None for cell in row):
+                        continue
+
+                    try:
+                        # 嘗試讀取各欄位
+                        point_id = row[0] if row[0] is not None else row_idx - 1
+                        img_x = row[1] if len(row) > 1 and row[1] is not None else None
+                        img_y = row[2] if len(row) > 2 and row[2] is not None else None
+                        world_x = row[3] if len(row) > 3 and row[3] is not None else None
+                        world_y = row[4] if len(row) > 4 and row[4] is not None else None
+
+                        # 檢查必要欄位是否有值
+                        if img_x is None or img_y is None or world_x is None or world_y is None:
+                            skip_count += 1
+                            continue
+
+                        # 轉換為數值
+                        imported_data.append([
+                            float(point_id),
+                            float(img_x),
+                            float(img_y),
+                            float(world_x),
+                            float(world_y)
+                        ])
+
+                    except (ValueError, TypeError):
+                        skip_count += 1
+                        continue
+            finally:
+                wb.close()
+
+            data = np.array(imported_data, dtype=np.float64).reshape(-1, 5)
+            self.finished.emit(data, skip_count)
+
         except Exception as e:
             self.error.emit(str(e))
@@ -0,0 +1,100 @@
+"""Tests for pyramid-accelerated checkerboard corner detection."""
+
+import cv2
+import numpy as np
+import pytest
+
+from vision_calib.core.corner_detector import CornerDetector
+from vision_calib.core.types import CheckerboardConfig
+
+ROWS, COLS = 6, 9
+SQUARE_PX = 150
+BORDER_PX = 250
+
+
+@pytest.fixture(scope="module")
+def config():
+    return CheckerboardConfig(rows=ROWS, cols=COLS, square_size_mm=25.0)
+
+
+@pytest.fixture(scope="module")
+def board():
+    """Grayscale board whose longest side exceeds DETECTION_MAX_DIM."""
+    height = (ROWS + 1) * SQUARE_PX + 2 * BORDER_PX
+    width = (COLS + 1) * SQUARE_PX + 2 * BORDER_PX
+    image = np.full((height, width), 255, dtype=np.uint8)
+    for r in range(ROWS + 1):
+        for c in range(COLS + 1):
+            if (r + c) % 2 == 0:
+                y = BORDER_PX + r * SQUARE_PX
+                x = BORDER_PX + c * SQUARE_PX
+                image[y:y + SQUARE_PX, x:x + SQUARE_PX] = 0
+    return cv2.GaussianBlur(image, (5, 5), 1.0)
+
+
+def test_board_exceeds_detection_max_dim(board):
+    assert max(board.shape) >= CornerDetector.DETECTION_MAX_DIM
+
+
+def test_pyramid_corners_match_full_resolution(board, config):
+    pyramid = CornerDetector(config).detect(board)
+
+    full_res = CornerDetector(config)
+    full_res.DETECTION_MAX_DIM = max(board.shape) + 1
+    reference = full_res.detect(board)
+
+    assert pyramid.success and reference.success
+    diff = np.abs(pyramid.get_corners_2d() - reference.get_corners_2d())
+    assert diff.max() < 0.1
+
+
+def test_pyramid_corners_land_on_grid(board, config):
+    result = CornerDetector(config).detect(board)
+    assert result.success
+
+    corners = result.get_corners_2d()
+    # Inner corners sit on square boundaries; pixel centres are at +0.5
+    expected_x = BORDER_PX + SQUARE_PX * np.arange(1, COLS + 1) - 0.5
+    expected_y = BORDER_PX + SQUARE_PX * np.arange(1, ROWS + 1) - 0.5
+    xs = np.sort(np.unique(np.round(corners[:, 0])))
+    ys = np.sort(np.unique(np.round(corners[:, 1])))
+    assert len(xs) == COLS and len(ys) == ROWS
+    nearest_x = expected_x[np.abs(corners[:, :1] - expected_x).argmin(axis=1)]
+    nearest_y = expected_y[np.abs(corners[:, 1:] - expected_y).argmin(axis=1)]
+    assert np.abs(corners[:, 0] - nearest_x).max() < 0.5
+    assert np.abs(corners[:, 1] - nearest_y).max() < 0.5
+
+
+def test_falls_back_to_full_resolution(board, config, monkeypatch):
+    find = cv2.findChessboardCorners
+    searched_shapes = []
+
+    def fail_when_downscaled(image, pattern_size, *args, **kwargs):
+        searched_shapes.append(image.shape[:2])
+        if image.shape[:2] != board.shape[:2]:
+            return False, None
+        return find(image, pattern_size, *args, **kwargs)
+
+    monkeypatch.setattr(cv2, "findChessboardCorners", fail_when_downscaled)
+    result = CornerDetector(config).detect(board)
+
+    assert result.success
+    assert result.num_corners == config.num_corners
+    assert len(searched_shapes) == 2
+    assert max(searched_shapes[0]) < CornerDetector.DETECTION_MAX_DIM
+    assert searched_shapes[1] == board.shape[:2]
+
+
+def test_small_image_skips_pyramid(config, monkeypatch):
+    image = np.full((480, 640), 255, dtype=np.uint8)
+    searched_shapes = []
+
+    def record(image, pattern_size, *args, **kwargs):
+        searched_shapes.append(image.shape[:2])
+        return False, None
+
+    monkeypatch.setattr(cv2, "findChessboardCorners", record)
+    result = CornerDetector(config).detect(image)
+
+    assert not result.success
+    assert searched_shapes == [(480, 640)]
@@ -0,0 +1,69 @@
+"""Tests for intrinsic calibration."""
+
+import cv2
+import numpy as np
+import pytest
+
+from vision_calib.core.corner_detector import CornerDetectionResult
+from vision_calib.core.intrinsic import IntrinsicCalibrationConfig, IntrinsicCalibrator
+from vision_calib.core.types import CalibrationCancelledError, CheckerboardConfig
+
+IMAGE_SIZE = (1280, 960)
+CAMERA_MATRIX = np.array(
+    [[1000.0, 0.0, 640.0], [0.0, 1000.0, 480.0], [0.0, 0.0, 1.0]]
+)
+POSES = [
+    ((0.1, -0.2, 0.05), (-100.0, -60.0, 600.0)),
+    ((-0.25, 0.1, -0.1), (-80.0, -90.0, 650.0)),
+    ((0.3, 0.25, 0.0), (-120.0, -50.0, 700.0)),
+    ((-0.1, -0.3, 0.2), (-90.0, -70.0, 550.0)),
+]
+
+
+@pytest.fixture
+def calibrator():
+    """Calibrator fed with synthetic, noise-free detections."""
+    checkerboard = CheckerboardConfig(rows=6, cols=9, square_size_mm=25.0)
+    calibrator = IntrinsicCalibrator(IntrinsicCalibrationConfig(checkerboard=checkerboard))
+    object_points = checkerboard.generate_object_points()
+    for rvec, tvec in POSES:
+        corners, _ = cv2.projectPoints(
+            object_points,
+            np.array(rvec),
+            np.array(tvec),
+            CAMERA_MATRIX,
+            np.zeros(5),
+        )
+        calibrator.add_detection(
+            CornerDetectionResult(
+                success=True,
+                corners=corners.astype(np.float32),
+                image_path=None,
+                image_size=IMAGE_SIZE,
+            )
+        )
+    return calibrator
+
+
+def test_calibrate_recovers_camera_matrix(calibrator):
+    steps = []
+    result = calibrator.calibrate(lambda current, total, message: steps.append(current))
+
+    np.testing.assert_allclose(result.intrinsic.camera_matrix, CAMERA_MATRIX, atol=1.0)
+    assert result.intrinsic.reprojection_error < 0.01
+    assert len(result.per_image_errors) == len(POSES)
+    assert steps[-1] == 100
+
+
+@pytest.mark.parametrize("cancel_at", [0, 10, 80])
+def test_truthy_progress_callback_cancels(calibrator, cancel_at):
+    def progress(current, total, message):
+        return current >= cancel_at
+
+    with pytest.raises(CalibrationCancelledError):
+        calibrator.calibrate(progress)
+
+
+def test_falsy_progress_callback_does_not_cancel(calibrator):
+    result = calibrator.calibrate(lambda *args: None)
+    assert result.intrinsic.reprojection_error < 0.01
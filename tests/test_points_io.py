@@ -0,0 +1,80 @@
+"""Tests for point-data CSV import and structured NPY export."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("PySide6")
+
+from vision_calib.ui.main_window import (  # noqa: E402
+    _POINT_FIELDS,
+    _parse_point_csv,
+    _points_to_structured,
+)
+
+
+def test_parse_canonical_header():
+    lines = [
+        "id,image_x,image_y,world_x,world_y",
+        "7,10.5,20.25,100,200",
+        "8,11.5,21.25,110,210",
+    ]
+    rows = _parse_point_csv(lines)
+    np.testing.assert_allclose(
+        rows,
+        [[7, 10.5, 20.25, 100, 200], [8, 11.5, 21.25, 110, 210]],
+    )
+
+
+def test_parse_header_aliases_and_column_order():
+    lines = [
+        "Y,X,y,x,ID",
+        "200,100,20,10,5",
+    ]
+    rows = _parse_point_csv(lines)
+    np.testing.assert_allclose(rows, [[5, 10, 20, 100, 200]])
+
+
+def test_parse_missing_world_columns_default_to_zero():
+    lines = [
+        "img_x,img_y",
+        "1,2",
+        "3,4",
+    ]
+    rows = _parse_point_csv(lines)
+    np.testing.assert_allclose(rows, [[1, 1, 2, 0, 0], [2, 3, 4, 0, 0]])
+
+
+def test_parse_single_row():
+    rows = _parse_point_csv(["id,image_x,image_y,world_x,world_y", "1,2,3,4,5"])
+    assert rows.shape == (1, 5)
+    np.testing.assert_allclose(rows, [[1, 2, 3, 4, 5]])
+
+
+def test_parse_single_row_single_column():
+    rows = _parse_point_csv(["x", "9.5"])
+    np.testing.assert_allclose(rows, [[1, 9.5, 0, 0, 0]])
+
+
+def test_parse_header_only():
+    rows = _parse_point_csv(["id,image_x,image_y,world_x,world_y", ""])
+    assert rows.shape == (0, 5)
+
+
+def test_parse_quoted_values():
+    rows = _parse_point_csv(['"id","image_x","image_y"', '"3","1.5","2.5"'])
+    np.testing.assert_allclose(rows, [[3, 1.5, 2.5, 0, 0]])
+
+
+def test_structured_npy_round_trip(tmp_path):
+    points = np.array(
+        [[1, 10.5, 20.25, 100.0, 200.0], [2, 11.5, 21.25, -110.0, 210.5]]
+    )
+    path = tmp_path / "points.npy"
+    np.save(path, _points_to_structured(points), allow_pickle=False)
+
+    loaded = np.load(path, allow_pickle=False)
+    assert loaded.dtype.names == _POINT_FIELDS
+    assert loaded["id"].dtype == np.int32
+    np.testing.assert_array_equal(loaded["id"], [1, 2])
+    restored = np.column_stack([loaded[name] for name in _POINT_FIELDS])
+    np.testing.assert_allclose(restored, points)